@@ -12,6 +12,11 @@ import yaml
 from cerberus import Validator
 from yaml.error import YAMLError
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from .constant import RFC_3339_DATETIME_FORMAT
 from .schema import schema
 
@@ -53,7 +58,8 @@ class Configuration:
         self.file_name = file_name
         try:
             with open(file_name, encoding="utf-8") as stream:
-                self.__configurations = yaml.safe_load(stream)
+                # the libyaml based loader is used when PyYAML was built with it, it parses the same documents faster.
+                self.__configurations = yaml.load(stream, Loader=SafeLoader)
         except YAMLError as exception:
             raise ConfigurationParsingException(file_name, exception)
         self.__configurations = self.validate()
@@ -9,6 +9,8 @@
 
 RFC_3339_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 BATCH_SIZE = 100
+# Maximum number of records the Zoom list endpoints return in a single page.
+ZOOM_MAX_PAGE_SIZE = 300
 ROLES = "roles"
 GROUPS = "groups"
 USERS = "users"
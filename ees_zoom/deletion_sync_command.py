@@ -19,7 +19,7 @@ from .constant import (BATCH_SIZE, CHANNELS, CHATS, FILES, GROUPS, MEETINGS,
                        PAST_MEETINGS, RECORDINGS, RFC_3339_DATETIME_FORMAT,
                        ROLES, USERS)
 from .sync_zoom import SyncZoom
-from .utils import (get_current_time,
+from .utils import (get_current_time, parse_rfc_3339_datetime,
                     split_documents_into_equal_chunks)
 
 MULTITHREADED_OBJECTS_FOR_DELETION = "multithreaded_objects_for_deletion"
@@ -109,7 +109,10 @@ class DeletionSyncCommand(BaseCommand):
         )
         for role_id in roles_ids_list:
             try:
-                _ = self.zoom_client.get(end_point=f"roles/{role_id}", key="privileges")
+                # privileges of the existing roles are cached and reused while checking their chat access
+                _ = self.zoom_client.get(
+                    end_point=f"roles/{role_id}", key="privileges", use_cache=True
+                )
             except requests.exceptions.HTTPError as HTTPException:
                 # Getting error code 400 but the zoom api documentation is suggesting error code 300
                 if HTTPException.__dict__["response"].status_code in [300, 400]:
@@ -201,8 +204,9 @@ class DeletionSyncCommand(BaseCommand):
                 {},
                 {},
             )
-            partitioned_users_buckets = sync_zoom.get_all_users_from_zoom()
-            _ = sync_zoom.perform_sync(ROLES_FOR_DELETION, [{}])
+            partitioned_users_buckets, _ = sync_zoom.get_all_users_and_perform_roles_sync(
+                ROLES_FOR_DELETION
+            )
             global_keys = self.create_and_execute_jobs(
                 self.zoom_sync_thread_count,
                 sync_zoom.perform_sync,
@@ -261,7 +265,7 @@ class DeletionSyncCommand(BaseCommand):
         ) + relativedelta(days=-30)
         documents_list_to_omit = []
         for document in storage_with_collection["delete_keys"]:
-            if document["type"] in [CHATS, FILES] and datetime.strptime(document["created_at"], RFC_3339_DATETIME_FORMAT) < six_months_ago:
+            if document["type"] in [CHATS, FILES] and parse_rfc_3339_datetime(document["created_at"]) < six_months_ago:
                 documents_list_to_omit.extend(
                     self.omitted_document(
                         document,
@@ -270,7 +274,7 @@ class DeletionSyncCommand(BaseCommand):
                         CHATS_HISTORY_EXPIRATION_TIME,
                     )
                 )
-            elif document["type"] in [RECORDINGS, PAST_MEETINGS, MEETINGS] and datetime.strptime(document["created_at"], RFC_3339_DATETIME_FORMAT) < one_month_ago:
+            elif document["type"] in [RECORDINGS, PAST_MEETINGS, MEETINGS] and parse_rfc_3339_datetime(document["created_at"]) < one_month_ago:
                 documents_list_to_omit.extend(
                     self.omitted_document(
                         document,
@@ -48,8 +48,10 @@ class IncrementalSyncCommand(BaseCommand):
                 queue,
                 self.zoom_enterprise_search_mappings,
             )
-            partitioned_users_lists = sync_zoom.get_all_users_from_zoom()
-            fetched_roles_id_list = sync_zoom.perform_sync(ROLES, [{}])
+            (
+                partitioned_users_lists,
+                fetched_roles_id_list,
+            ) = sync_zoom.get_all_users_and_perform_roles_sync(ROLES)
             metadata_of_fetched_documents = self.create_and_execute_jobs(
                 thread_count,
                 sync_zoom.perform_sync,
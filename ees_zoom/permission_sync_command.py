@@ -80,7 +80,7 @@ class PermissionSyncCommand(BaseCommand):
         roles_obj.set_list_of_roles_from_zoom()
         for role in roles_obj.roles_list:
             role_permissions = roles_obj.fetch_role_permissions(role["id"])
-            role_members_ids = roles_obj.fetch_members_of_role(role["id"])
+            role_members_ids = set(roles_obj.fetch_members_of_role(role["id"]))
             for zoom_user, enterprise_search_users in mappings.items():
                 if zoom_user in role_members_ids:
                     for enterprise_search_user in enterprise_search_users:
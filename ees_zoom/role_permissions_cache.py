@@ -0,0 +1,57 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+"""role_permissions_cache module allows to remember across syncs whether a Zoom role has read access
+for chat messages, so that the permissions of a role are not fetched from Zoom on every sync.
+"""
+import json
+import os
+
+ROLE_PERMISSIONS_CACHE_PATH = os.path.join(
+    os.path.dirname(__file__), "role_permissions_cache.json"
+)
+HAS_CHAT_ACCESS_FIELD = "has_chat_access"
+FETCHED_AT_FIELD = "fetched_at"
+
+
+class RolePermissionsCache:
+    """This Class handles the fetching and storing of the chat access of roles to and from the local cache file."""
+
+    def __init__(self, logger) -> None:
+        self.logger = logger
+
+    def get_cache(self):
+        """The module returns a dictionary containing the role ids mapped with their chat access and the time
+        at which the permissions of the role were fetched.
+        :returns role_permissions: a dictionary with role id as key and a dictionary containing has_chat_access
+        and fetched_at as value. Empty dictionary if the cache file is absent or corrupted.
+        """
+        try:
+            with open(ROLE_PERMISSIONS_CACHE_PATH, encoding="UTF-8") as cache_store:
+                content = cache_store.read()
+        except FileNotFoundError:
+            return {}
+        if content:
+            try:
+                return json.loads(content)
+            except ValueError as exception:
+                self.logger.exception(
+                    f"Error while parsing the role permissions cache from path: {ROLE_PERMISSIONS_CACHE_PATH}. Error: {exception}"
+                )
+        return {}
+
+    def set_cache(self, role_permissions):
+        """The module stores a dictionary containing the chat access of roles in to the local cache file.
+        :param role_permissions: a dictionary with role id as key and a dictionary containing has_chat_access
+        and fetched_at as value.
+        """
+        with open(ROLE_PERMISSIONS_CACHE_PATH, "w", encoding="UTF-8") as cache_store:
+            try:
+                json.dump(role_permissions, cache_store, indent=4)
+                self.logger.info("Successfully saved the role permissions cache")
+            except Exception as exception:
+                self.logger.exception(
+                    f"Error while updating the role permissions cache.\nError: {exception}"
+                )
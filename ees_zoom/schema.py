@@ -216,6 +216,12 @@ schema = {
         "default": 3,
         "min": 1,
     },
+    "role_permissions_cache_ttl": {
+        "required": False,
+        "type": "integer",
+        "default": 0,
+        "min": 0,
+    },
     "zoom_sync_thread_count": {
         "required": False,
         "type": "integer",
@@ -26,15 +26,19 @@ class SecretsStorage:
         :returns secret_store_data: a dictionary containing refresh token, access token and expiration time
         of access token(UTC format) from the secrets storage.
         """
-        if os.path.exists(SECRETS_JSON_PATH) and os.path.getsize(SECRETS_JSON_PATH) > 0:
+        try:
             with open(SECRETS_JSON_PATH, encoding="UTF-8") as secrets_store:
-                try:
-                    secrets = json.load(secrets_store)
-                    return secrets
-                except ValueError as exception:
-                    self.logger.exception(
-                        f"Error while parsing the secrets storage from path: {SECRETS_JSON_PATH}. Error: {exception}"
-                    )
+                content = secrets_store.read()
+        except FileNotFoundError:
+            return None
+        if content:
+            try:
+                secrets = json.loads(content)
+                return secrets
+            except ValueError as exception:
+                self.logger.exception(
+                    f"Error while parsing the secrets storage from path: {SECRETS_JSON_PATH}. Error: {exception}"
+                )
 
     def set_secrets(self, secrets):
         """The module stores a dictionary containing refresh token, access token and expiration time
@@ -66,7 +66,10 @@ class SyncEnterpriseSearch:
             signal_open = True
             while signal_open:
                 documents_to_index = []
-                while len(documents_to_index) < BATCH_SIZE and len(str(documents_to_index)) < self.max_allowed_bytes:
+                # size of the documents is accumulated per fetched batch instead of serializing all the
+                # collected documents again on every iteration.
+                documents_to_index_size = 0
+                while len(documents_to_index) < BATCH_SIZE and documents_to_index_size < self.max_allowed_bytes:
                     documents = self.queue.get()
                     if documents.get("type") == "signal_close":
                         self.logger.info(
@@ -85,6 +88,7 @@ class SyncEnterpriseSearch:
                         break
                     else:
                         documents_to_index.extend(documents.get("data"))
+                        documents_to_index_size += len(str(documents.get("data")))
                 # This loop is to ensure if the last document fetched from the queue exceeds the size of
                 # documents_to_index to more than the permitted chunk size, then we split the documents as per the limit
                 documents_to_index = list(unique_everseen(documents_to_index))
@@ -6,11 +6,13 @@
 """sync_zoom module allows to sync data to Elastic Enterprise Search.
 It's possible to run full syncs and incremental syncs with this module."""
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from .adapter import DEFAULT_SCHEMA
-from .constant import (CHANNELS, CHATS, FILES, GROUPS, MEETINGS, PAST_MEETINGS,
-                       RECORDINGS, ROLES, USERS)
-from .utils import split_list_into_buckets
+from .constant import (BATCH_SIZE, CHANNELS, CHATS, FILES, GROUPS, MEETINGS,
+                       PAST_MEETINGS, RECORDINGS, ROLES, USERS)
+from .utils import (split_iterable_into_buckets, split_iterable_into_chunks,
+                    split_list_into_buckets)
 from .zoom_channels import ZoomChannels
 from .zoom_groups import ZoomGroups
 from .zoom_chat_messages import ZoomChatMessages
@@ -84,12 +86,24 @@ class SyncZoom:
             self.zoom_client,
             self.zoom_enterprise_search_mappings,
         )
-        partitioned_users_lists = split_list_into_buckets(
-            documents=users_object.get_users_list(),
+        partitioned_users_lists = split_iterable_into_buckets(
+            documents=users_object.iter_users(),
             total_buckets=self.zoom_sync_thread_count,
         )
         return partitioned_users_lists
 
+    def get_all_users_and_perform_roles_sync(self, roles_parent_object):
+        """Fetches the users from Zoom in the background while the roles are synced, as both depend only on
+        independent Zoom endpoints.
+        :param roles_parent_object: Parent object name for roles.(ex.: ROLES(for indexing) and
+            ROLES_FOR_DELETION(for deletion))
+        :returns: list of partitioned users lists and list of locally stored details of roles documents.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            partitioned_users_lists_future = executor.submit(self.get_all_users_from_zoom)
+            fetched_roles_id_list = self.perform_sync(roles_parent_object, [{}])
+            return partitioned_users_lists_future.result(), fetched_roles_id_list
+
     def fetch_users_and_append_to_queue(self, partitioned_users_list):
         """This method fetches the users from Zoom server and
         appends them to the shared queue
@@ -145,7 +159,7 @@ class SyncZoom:
     def get_past_meetings(self, meetings_object):
         """This method fetches the past-meetings from Zoom server.
         :param meetings_object: ZoomMeetings Object.
-        :returns: list of past-meetings documents.
+        :yields: list of past-meetings documents containing at most BATCH_SIZE documents.
         """
         past_meetings_object = ZoomPastMeetings(
             self.config,
@@ -154,16 +168,14 @@ class SyncZoom:
             self.zoom_enterprise_search_mappings,
         )
         past_meetings_schema = self.get_schema_fields(PAST_MEETINGS)
-        fetched_documents = []
-        fetched_documents = past_meetings_object.get_past_meetings_details_documents(
+        fetched_documents = past_meetings_object.iter_past_meetings_details_documents(
             meetings_data=meetings_object.meetings_past_meetings_list,
             past_meetings_schema=past_meetings_schema,
             start_time=self.objects_time_range[PAST_MEETINGS][0],
             end_time=self.objects_time_range[PAST_MEETINGS][1],
             enable_permission=self.enable_permission,
         )
-        past_meetings_data = fetched_documents["data"]
-        return past_meetings_data
+        yield from split_iterable_into_chunks(fetched_documents, BATCH_SIZE)
 
     def fetch_roles_and_append_to_queue(self, roles_object):
         """This method fetches the roles from Zoom server and
@@ -209,9 +221,8 @@ class SyncZoom:
     def get_recordings(self, partitioned_users_list):
         """This method fetches the recordings from Zoom server.
         :param partitioned_users_list: list of users for which recordings will be fetched.
-        :returns: list of recordings documents.
+        :yields: list of recordings documents containing at most BATCH_SIZE documents.
         """
-        fetched_documents = []
         recordings_schema = self.get_schema_fields(RECORDINGS)
         recordings_object = ZoomRecordings(
             self.config,
@@ -219,15 +230,14 @@ class SyncZoom:
             self.zoom_client,
             self.zoom_enterprise_search_mappings,
         )
-        fetched_documents = recordings_object.get_recordings_details_documents(
+        fetched_documents = recordings_object.iter_recordings_details_documents(
             users_data=partitioned_users_list,
             recordings_schema=recordings_schema,
             start_time=self.objects_time_range[RECORDINGS][0],
             end_time=self.objects_time_range[RECORDINGS][1],
             enable_permission=self.enable_permission,
         )
-        recording_data = fetched_documents["data"]
-        return recording_data
+        yield from split_iterable_into_chunks(fetched_documents, BATCH_SIZE)
 
     def get_channels(self, partitioned_users_list):
         """This method fetches the channels from Zoom server.
@@ -250,6 +260,23 @@ class SyncZoom:
         channels_data = fetched_documents["data"]
         return channels_data
 
+    def get_ids_storage_details(self, documents):
+        """This method returns the locally stored details of the documents passed.
+        :param documents: list of documents generated for the zoom objects.
+        :returns: list of dictionary containing the properties (id, type, parent_id, created_at) of the documents.
+        """
+        ids_storage = []
+        for document in documents:
+            ids_storage.append(
+                {
+                    "id": str(document["id"]),
+                    "type": document["type"],
+                    "parent_id": document.get("parent_id", ""),
+                    "created_at": document.get("created_at", ""),
+                }
+            )
+        return ids_storage
+
     def perform_sync(self, parent_object, partitioned_users_list):
         """This method fetches all the objects from Zoom server and appends them to the
         shared queue and it returns list of locally stored details of documents fetched.
@@ -330,16 +357,16 @@ class SyncZoom:
                     self.logger.info(
                         f"Thread: [{threading.get_ident()}] fetching {PAST_MEETINGS}."
                     )
-                    past_meetings_documents = self.get_past_meetings(meetings_object)
-                    documents_to_index.extend(past_meetings_documents)
-                    self.queue.append_to_queue(past_meetings_documents)
+                    # past-meetings and recordings are streamed in chunks so that only the
+                    # locally stored details of the documents are retained after they are queued.
+                    for past_meetings_documents in self.get_past_meetings(meetings_object):
+                        ids_storage.extend(self.get_ids_storage_details(past_meetings_documents))
+                        self.queue.append_to_queue(past_meetings_documents)
                 if RECORDINGS in self.configuration_objects:
-                    recordings_documents = self.get_recordings(
-                        partitioned_users_list,
-                    )
-                    documents_to_index.extend(recordings_documents)
-                    if parent_object != MULTITHREADED_OBJECTS_FOR_DELETION:
-                        self.queue.append_to_queue(recordings_documents)
+                    for recordings_documents in self.get_recordings(partitioned_users_list):
+                        ids_storage.extend(self.get_ids_storage_details(recordings_documents))
+                        if parent_object != MULTITHREADED_OBJECTS_FOR_DELETION:
+                            self.queue.append_to_queue(recordings_documents)
                 if CHANNELS in self.configuration_objects:
                     channels_documents = self.get_channels(
                         partitioned_users_list,
@@ -395,13 +422,5 @@ class SyncZoom:
             self.logger.error(
                 f"{[threading.get_ident()]} Error while fetching objects. Error: {exception}"
             )
-        for document in documents_to_index:
-            ids_storage.append(
-                {
-                    "id": str(document["id"]),
-                    "type": document["type"],
-                    "parent_id": document.get("parent_id", ""),
-                    "created_at": document.get("created_at", ""),
-                }
-            )
+        ids_storage.extend(self.get_ids_storage_details(documents_to_index))
         return ids_storage
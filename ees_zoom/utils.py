@@ -8,6 +8,7 @@
 import time
 import urllib.parse
 from datetime import datetime
+from operator import itemgetter
 
 import tika
 from requests.exceptions import ReadTimeout
@@ -111,6 +112,18 @@ def split_list_into_buckets(documents, total_buckets):
         return []
 
 
+def split_iterable_into_buckets(documents, total_buckets):
+    """Divide documents amongst the total buckets in a round-robin manner while consuming them
+    from an iterable, so that the documents don't have to be collected in a list first
+    :param documents: iterable to be partitioned
+    :param total_buckets: number of buckets to be formed
+    """
+    group_list = [[] for _ in range(total_buckets)]
+    for index, document in enumerate(documents):
+        group_list[index % total_buckets].append(document)
+    return [group for group in group_list if group]
+
+
 def split_documents_into_equal_chunks(documents, chunk_size):
     """This method splits a list or dictionary into equal chunks size
     :param documents: List or Dictionary to be partitioned into chunks
@@ -128,6 +141,65 @@ def split_documents_into_equal_chunks(documents, chunk_size):
     return list_of_chunks
 
 
+def split_iterable_into_chunks(documents, chunk_size):
+    """This method lazily splits an iterable into lists of at most chunk_size elements
+    :param documents: Iterable (e.g. a generator of documents) to be partitioned into chunks
+    :param chunk_size: Maximum size of a chunk
+    Yields:
+        chunk: List containing at most chunk_size elements
+    """
+    chunk = []
+    for document in documents:
+        chunk.append(document)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def get_schema_projection(schema):
+    """Builds a function, once per schema, which projects the source fields of a Zoom object into
+    a dictionary keyed on the Enterprise Search fields. Raises KeyError if a source field is missing.
+    :param schema: dictionary of Enterprise Search fields mapped to the Zoom fields.
+    Returns:
+        project: function accepting a Zoom object and returning the projected dictionary.
+    """
+    ws_fields = tuple(schema.keys())
+    if not ws_fields:
+        return lambda zoom_object: {}
+    get_zoom_fields = itemgetter(*schema.values())
+    if len(ws_fields) == 1:
+        (ws_field,) = ws_fields
+        return lambda zoom_object: {ws_field: get_zoom_fields(zoom_object)}
+    return lambda zoom_object: dict(zip(ws_fields, get_zoom_fields(zoom_object)))
+
+
+def parse_rfc_3339_datetime(date_string):
+    """Parses a datetime string in RFC 3339 format (YYYY-MM-DDTHH:MM:SSZ) into a datetime object.
+    Slicing the fixed width fields is much faster than strptime, which is used as fallback for any other layout.
+    :param date_string: datetime string in rfc 3339 format.
+    Returns:
+        datetime object for the passed string.
+    """
+    # the separators of the fixed width layout are every third character starting at index 4.
+    if len(date_string) == 20 and date_string[4::3] == "--T::Z":
+        fields = (
+            date_string[0:4],
+            date_string[5:7],
+            date_string[8:10],
+            date_string[11:13],
+            date_string[14:16],
+            date_string[17:19],
+        )
+        if all(field.isdigit() for field in fields):
+            try:
+                return datetime(*map(int, fields))
+            except ValueError:
+                pass
+    return datetime.strptime(date_string, RFC_3339_DATETIME_FORMAT)
+
+
 def get_current_time():
     """Returns current time in rfc 3339 format"""
     return (datetime.utcnow()).strftime(RFC_3339_DATETIME_FORMAT)
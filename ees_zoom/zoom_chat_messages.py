@@ -12,7 +12,7 @@ from datetime import datetime
 import requests
 from dateutil.relativedelta import relativedelta
 
-from .constant import CHATS, FILES
+from .constant import CHATS, FILES, ZOOM_MAX_PAGE_SIZE
 from .utils import constraint_time_range, extract, retry
 
 TIME_CONSTRAINT_FOR_CHATS = (datetime.utcnow()) + relativedelta(days=-180)
@@ -40,7 +40,7 @@ class ZoomChatMessages:
         user_chats = []
         try:
             url = (
-                f"chat/users/{user_id}/messages?page_size=300&search_key=%20"
+                f"chat/users/{user_id}/messages?page_size={ZOOM_MAX_PAGE_SIZE}&search_key=%20"
                 f"&search_type=message&from={start_time}&to={end_time}"
             )
             user_chats = self.zoom_client.get(
@@ -122,7 +122,7 @@ class ZoomChatMessages:
         user_files = []
         try:
             url = (
-                f"chat/users/{user_id}/messages?page_size=300&search_key=%20&"
+                f"chat/users/{user_id}/messages?page_size={ZOOM_MAX_PAGE_SIZE}&search_key=%20&"
                 f"search_type=file&from={start_time}&to={end_time}"
             )
             user_files = self.zoom_client.get(
@@ -12,6 +12,12 @@ import time
 
 import requests
 import requests.exceptions
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from .secrets_storage import SecretsStorage
 from .utils import retry
@@ -21,6 +27,11 @@ ZOOM_BASE_URL = "https://api.zoom.us/v2/"
 REFRESH_TOKEN_FIELD = "zoom.refresh_token"
 ACCESS_TOKEN_FIELD = "zoom.access_token"
 EXPIRATION_TIME_FIELD = "zoom.access_token_expiry_time"
+RESPONSE_CACHE_TTL = 300  # Time to live of a cached response in seconds
+RESPONSE_CACHE_MAX_SIZE = 4096
+REQUEST_TIMEOUT = 30  # Timeout of a single Zoom api call in seconds
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAX_SIZE = 20
 
 
 class AccessTokenGenerationException(Exception):
@@ -36,6 +47,21 @@ class AccessTokenGenerationException(Exception):
 lock = threading.Lock()
 
 
+def create_session():
+    """Creates the requests session used for the Zoom api calls. The session keeps the connections alive,
+    so paginated calls skip the TCP and TLS handshakes.
+    :returns session: requests Session instance
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAX_SIZE
+        ),
+    )
+    return session
+
+
 class ZoomClient:
     """This class is used to generate the access token to call different Zoom Apis."""
 
@@ -50,22 +76,28 @@ class ZoomClient:
         self.config_file_path = config.file_name
         self.access_token_expiration = time.time()
         self.is_token_generated = False
+        self.response_cache = {}
+        self.response_cache_lock = threading.Lock()
+        self.session = create_session()
+        self.request_headers = None
 
     def get_headers(self):
-        """generates header to fetch refresh token from zoom.
+        """generates header to fetch refresh token from zoom. The header only depends on the client credentials,
+        so it is generated once and reused for every token request of the client.
 
         Returns:
             request_headers: header to be used for requesting refresh token from Zoom.
         """
-        credentials = f"{self.client_id}:{self.client_secret}"
-        credentials_bytes = credentials.encode("ascii")
-        base64_bytes = base64.b64encode(credentials_bytes)
-        base64_credentials = base64_bytes.decode("ascii")
-        request_headers = {
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Authorization": f"Basic {base64_credentials}",
-        }
-        return request_headers
+        if self.request_headers is None:
+            credentials = f"{self.client_id}:{self.client_secret}"
+            credentials_bytes = credentials.encode("ascii")
+            base64_bytes = base64.b64encode(credentials_bytes)
+            base64_credentials = base64_bytes.decode("ascii")
+            self.request_headers = {
+                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+                "Authorization": f"Basic {base64_credentials}",
+            }
+        return self.request_headers
 
     def handle_4xx_error(self, json_data, http_error):
         """Module handles 4xx error ocurred while fetching tokens from Zoom.
@@ -125,7 +157,9 @@ class ZoomClient:
 
         if self.access_token_expiration and time.time() < self.access_token_expiration:
             self.is_token_generated = False
-            self.access_token = secrets.get(ACCESS_TOKEN_FIELD, "")
+            # the access token generated by this client is kept when the secrets storage is not available.
+            if secrets:
+                self.access_token = secrets.get(ACCESS_TOKEN_FIELD, "")
             lock.release()
             return
 
@@ -163,41 +197,87 @@ class ZoomClient:
             if lock.locked():
                 lock.release()
 
+    def get_cached_response(self, cache_key):
+        """Returns a copy of the cached response for the cache key if it has not expired.
+        :param cache_key: tuple of the endpoint, response json key and pagination flag.
+        :returns: list of dictionary containing response from endpoint or None if not cached.
+        """
+        with self.response_cache_lock:
+            cached_response = self.response_cache.get(cache_key)
+            if not cached_response:
+                return None
+            cached_time, api_response = cached_response
+            if time.time() - cached_time > RESPONSE_CACHE_TTL:
+                del self.response_cache[cache_key]
+                return None
+            return list(api_response)
+
+    def set_cached_response(self, cache_key, api_response):
+        """Stores a copy of the response in the cache. The expired entries are dropped and the oldest entry
+        is evicted when the cache is full.
+        :param cache_key: tuple of the endpoint, response json key and pagination flag.
+        :param api_response: list of dictionary containing response from endpoint.
+        """
+        with self.response_cache_lock:
+            current_time = time.time()
+            expired_cache_keys = [
+                cached_key
+                for cached_key, (cached_time, _) in self.response_cache.items()
+                if current_time - cached_time > RESPONSE_CACHE_TTL
+            ]
+            for expired_cache_key in expired_cache_keys:
+                del self.response_cache[expired_cache_key]
+            if cache_key not in self.response_cache and len(self.response_cache) >= RESPONSE_CACHE_MAX_SIZE:
+                del self.response_cache[next(iter(self.response_cache))]
+            self.response_cache[cache_key] = (current_time, list(api_response))
+
+    def clear_response_cache(self):
+        """Removes all the cached responses."""
+        with self.response_cache_lock:
+            self.response_cache.clear()
+
     @retry(
         exception_list=(
             requests.exceptions.ConnectionError,
             requests.exceptions.Timeout,
         )
     )
-    def get(self, end_point, key, is_paginated=False):
-        """Makes get call to Zoom api endpoint
+    def send_get_request(self, url):
+        """Makes a single get call to the Zoom api url using the current access token
+
+        :param url: complete url of the endpoint with query parameters
+        :returns response: response object received from Zoom.
+        """
+        headers = {
+            "authorization": f"Bearer {self.access_token}",
+            "content-type": "application/json",
+        }
+        return self.session.get(url=url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+    def iter_responses(self, end_point, key, is_paginated=False):
+        """Makes get calls to Zoom api endpoint and lazily yields the parsed json response of each page,
+        so that only one page is held in memory at a time.
 
         :param end_point: endpoint url with query parameters
         :param key: Response json key to parse on successful get call
-        :returns api_response: list of dictionary containing response from endpoint.
+        :param is_paginated: boolean to check if the endpoint has to be paginated or not.
+        :yields response: dictionary containing the json response of a page.
         """
         # Set access token either from secrets storage or fetch new one from Zoom in case it is expired
         self.ensure_token_valid()
         next_page_token = True
-        api_response = []
+        base_url = f"{ZOOM_BASE_URL}{end_point}"
+        next_page_url = f"{base_url}&next_page_token="
 
         while next_page_token:
-            url = f"{ZOOM_BASE_URL}{end_point}"
-            if next_page_token is not True:
-                url = f"{url}&next_page_token={next_page_token}"
-            headers = {
-                "authorization": f"Bearer {self.access_token}",
-                "content-type": "application/json",
-            }
+            url = base_url if next_page_token is True else next_page_url + next_page_token
 
-            response = requests.get(url=url, headers=headers)
+            response = self.send_get_request(url)
 
-            if response and response.status_code == 200:
-                response = json.loads(response.text)
-                if key == "past_meetings":
-                    return response
-                if response.get(key):
-                    api_response.extend(response[key])
+            if response.status_code == 200:
+                # the raw bytes are parsed directly instead of decoding them to text first.
+                response = json_loads(response.content)
+                yield response
                 next_page_token = (
                     response.get("next_page_token") if is_paginated else None
                 )
@@ -205,7 +285,42 @@ class ZoomClient:
             elif key == "privileges" and response.status_code in [300, 400]:
                 raise requests.exceptions.HTTPError(response=response)
             elif response.status_code == 401:
+                self.clear_response_cache()
                 self.ensure_token_valid()
             else:
                 response.raise_for_status()
+
+    def iter_pages(self, end_point, key):
+        """Makes get calls to paginated Zoom api endpoint and lazily yields the list of objects of each page
+
+        :param end_point: endpoint url with query parameters
+        :param key: Response json key to parse on successful get call
+        :yields: list of dictionary containing response of a page.
+        """
+        for response in self.iter_responses(end_point, key, is_paginated=True):
+            yield response.get(key) or []
+
+    def get(self, end_point, key, is_paginated=False, use_cache=False):
+        """Makes get call to Zoom api endpoint
+
+        :param end_point: endpoint url with query parameters
+        :param key: Response json key to parse on successful get call
+        :param is_paginated: boolean to check if the endpoint has to be paginated or not.
+        :param use_cache: boolean to reuse the response of a previous call to the same endpoint
+            made within RESPONSE_CACHE_TTL seconds.
+        :returns api_response: list of dictionary containing response from endpoint.
+        """
+        cache_key = (end_point, key, is_paginated)
+        if use_cache:
+            cached_response = self.get_cached_response(cache_key)
+            if cached_response is not None:
+                return cached_response
+        api_response = []
+        for response in self.iter_responses(end_point, key, is_paginated):
+            if key == "past_meetings":
+                return response
+            if response.get(key):
+                api_response.extend(response[key])
+        if use_cache:
+            self.set_cached_response(cache_key, api_response)
         return api_response
@@ -6,10 +6,10 @@
 """This module will fetch meeting details for each user id present in
 the list and will create documents from the fetched responses.
 """
-import datetime
 import threading
 
-from .constant import MEETINGS, RFC_3339_DATETIME_FORMAT
+from .constant import MEETINGS, ZOOM_MAX_PAGE_SIZE
+from .utils import parse_rfc_3339_datetime
 
 
 class ZoomMeetings:
@@ -37,7 +37,7 @@ class ZoomMeetings:
         meetings_for_user = []
         try:
             meetings_for_user = self.zoom_client.get(
-                end_point=f"users/{user_id}/meetings?page_size=300",
+                end_point=f"users/{user_id}/meetings?page_size={ZOOM_MAX_PAGE_SIZE}",
                 key=MEETINGS,
                 is_paginated=True,
             )
@@ -49,9 +49,7 @@ class ZoomMeetings:
         self.meetings_past_meetings_list.extend(meetings_for_user)
         meetings_list = []
         for meeting in meetings_for_user:
-            meeting_date = datetime.datetime.strptime(
-                meeting["created_at"], RFC_3339_DATETIME_FORMAT
-            )
+            meeting_date = parse_rfc_3339_datetime(meeting["created_at"])
             if meeting_date >= start_time and meeting_date <= end_time:
                 meetings_list.append(meeting)
         self.logger.info(
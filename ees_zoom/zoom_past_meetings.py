@@ -6,13 +6,14 @@
 """This module will fetch past_meetings details for each meeting id present in
 the list and will create documents from the fetched responses.
 """
-import datetime
 import json
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
-from .constant import PAST_MEETINGS, RFC_3339_DATETIME_FORMAT
+from .constant import PAST_MEETINGS, ZOOM_MAX_PAGE_SIZE
+from .utils import get_schema_projection, parse_rfc_3339_datetime
 
 
 class ZoomPastMeetings:
@@ -54,59 +55,57 @@ class ZoomPastMeetings:
                 f"Unknown error occurred while fetching past_meetings from Zoom. : {exception}"
             )
             raise exception
-        meeting_date = datetime.datetime.strptime(
-            past_meeting_details["end_time"], RFC_3339_DATETIME_FORMAT
-        )
+        meeting_date = parse_rfc_3339_datetime(past_meeting_details["end_time"])
         if meeting_date >= start_time and meeting_date <= end_time:
             return past_meeting_details
         return None
 
     def get_meeting_participants(self, past_meeting_id):
         """Method will get all the participants who attended the meeting.
+        Participants are projected page by page, so the complete response for all the participants
+        is never held in memory.
         :param past_meeting_id: Meeting id for which participants are fetched.
         :returns: List of valid meetings.
         """
-        participants_for_meeting = []
-
+        keys_to_index_from_participants_response = [
+            "id",
+            "name",
+            "join_time",
+            "leave_time",
+            "duration",
+        ]
+        participants_details = []
         try:
-            participants_for_meeting = self.zoom_client.get(
-                end_point=f"report/meetings/{past_meeting_id}/participants?page_size=300",
+            for participants_page in self.zoom_client.iter_pages(
+                end_point=f"report/meetings/{past_meeting_id}/participants?page_size={ZOOM_MAX_PAGE_SIZE}",
                 key="participants",
-                is_paginated=True,
-            )
+            ):
+                for participant in participants_page:
+                    participant_details = {
+                        key: val
+                        for key, val in participant.items()
+                        if key in keys_to_index_from_participants_response
+                    }
+                    participants_details.append(participant_details)
         except requests.exceptions.HTTPError as HTTPException:
             if HTTPException.__dict__["response"].status_code != 404:
                 self.logger.exception(
                     f"Unknown error occurred while fetching meeting participants from Zoom. Error: {HTTPException}"
                 )
                 raise
+            participants_details = []
         except Exception as exception:
             self.logger.exception(
                 f"Unknown error occurred while fetching meeting participants from Zoom: {exception}"
             )
             raise exception
         self.logger.info(
-            f"Thread: [{threading.get_ident()}] Fetched total : {len(participants_for_meeting)} "
+            f"Thread: [{threading.get_ident()}] Fetched total : {len(participants_details)} "
             f"number(s) of meetings participants for {past_meeting_id}."
         )
-        keys_to_index_from_participants_response = [
-            "id",
-            "name",
-            "join_time",
-            "leave_time",
-            "duration",
-        ]
-        participants_details = []
-        for participant in participants_for_meeting:
-            participant_details = {
-                key: val
-                for key, val in participant.items()
-                if key in keys_to_index_from_participants_response
-            }
-            participants_details.append(participant_details)
         return participants_details
 
-    def get_past_meetings_details_documents(
+    def iter_past_meetings_details_documents(
         self,
         meetings_data,
         past_meetings_schema,
@@ -115,15 +114,19 @@ class ZoomPastMeetings:
         enable_permission,
     ):
         """This Method will iterate over meetings list and will get all valid past_meetings
-        for the meetingID. it will create a document from the returned data ready to be indexed.
+        for the meetingID. it will lazily yield a document created from the returned data ready to be indexed,
+        so that the caller can drain the documents without holding all of them in memory.
         :param meetings_data: list of dictionaries where each dictionary contains details fetched for
         a meeting.
         :param past_meetings_schema: dictionary of fields to be indexed for past_meetings.
         :param start_time: datetime object for lower limit for data fetching.
         :param end_time: datetime object for upper limit for data fetching.
         :param enable_permission: boolean to check if permission sync is enabled or not.
-        :returns: dictionary containing type of data along with the data.
+        :yields: dictionary containing the past_meeting document.
         """
+        # the past_meeting details of the next meeting are fetched in the background while the participants of
+        # the current meeting are fetched, participants are fetched only for the past_meetings in the time range.
+        details_executor = ThreadPoolExecutor(max_workers=1)
         try:
             meeting_type_enum_to_name_mapping = {
                 "1": "An instant meeting",
@@ -131,21 +134,33 @@ class ZoomPastMeetings:
                 "3": "A recurring meeting with no fixed time",
                 "8": "A recurring meeting with fixed time",
             }
+            project_past_meeting = get_schema_projection(past_meetings_schema)
             past_meetings_count = 0
-            past_meetings_documents = []
-            for meeting in meetings_data:
-                past_meeting_dictionary = self.get_past_meeting_details_from_meeting_id(
-                    str(meeting["id"]), start_time, end_time
+            meetings_iterator = iter(meetings_data)
+            meeting = next(meetings_iterator, None)
+            if meeting is not None:
+                details_future = details_executor.submit(
+                    self.get_past_meeting_details_from_meeting_id,
+                    str(meeting["id"]),
+                    start_time,
+                    end_time,
                 )
+            while meeting is not None:
+                past_meeting_dictionary = details_future.result()
+                next_meeting = next(meetings_iterator, None)
+                if next_meeting is not None:
+                    details_future = details_executor.submit(
+                        self.get_past_meeting_details_from_meeting_id,
+                        str(next_meeting["id"]),
+                        start_time,
+                        end_time,
+                    )
                 if past_meeting_dictionary:
                     past_meeting_document = {
                         "type": PAST_MEETINGS,
                         "parent_id": str(meeting["id"]),
+                        **project_past_meeting(past_meeting_dictionary),
                     }
-                    for ws_field, zoom_fields in past_meetings_schema.items():
-                        past_meeting_document[ws_field] = past_meeting_dictionary[
-                            zoom_fields
-                        ]
                     participants_list = self.get_meeting_participants(meeting["id"])
                     if not len(participants_list):
                         # when meeting host is the only participant we will add it manually.
@@ -173,13 +188,13 @@ class ZoomPastMeetings:
                             )
                         )
                         past_meeting_document["_allow_permissions"] = permission_list
-                    past_meetings_documents.append(past_meeting_document)
                     past_meetings_count += 1
+                    yield past_meeting_document
+                meeting = next_meeting
             self.logger.info(
                 f"Thread: [{threading.get_ident()}] {past_meetings_count} number(s) of "
                 f"Past_Meetings documents generated."
             )
-            return {"type": PAST_MEETINGS, "data": past_meetings_documents}
         except KeyError as key_error_exception:
             self.logger.error(
                 f"Error {key_error_exception} occurred while generating past_meetings documents."
@@ -190,3 +205,5 @@ class ZoomPastMeetings:
                 f"Error occurred while preparing Documents for past_meetings: {exception}"
             )
             raise exception
+        finally:
+            details_executor.shutdown()
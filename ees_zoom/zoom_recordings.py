@@ -8,8 +8,9 @@ the list and will create a document from the fetched response.
 """
 import threading
 
-from .constant import MEETINGS, RFC_3339_DATETIME_FORMAT, RECORDINGS
-from .utils import url_encode
+from .constant import (MEETINGS, RECORDINGS, RFC_3339_DATETIME_FORMAT,
+                       ZOOM_MAX_PAGE_SIZE)
+from .utils import get_schema_projection, url_encode
 
 
 class ZoomRecordings:
@@ -38,7 +39,7 @@ class ZoomRecordings:
         """
         recordings_for_user = []
         try:
-            url = f"users/{user_id}/recordings?page_size=300&from={start_time}&to={end_time}"
+            url = f"users/{user_id}/recordings?page_size={ZOOM_MAX_PAGE_SIZE}&from={start_time}&to={end_time}"
             recordings_for_user = self.zoom_client.get(
                 end_point=url, key=MEETINGS, is_paginated=True
             )
@@ -53,7 +54,7 @@ class ZoomRecordings:
         )
         return recordings_for_user
 
-    def get_recordings_details_documents(
+    def iter_recordings_details_documents(
         self,
         users_data,
         recordings_schema,
@@ -62,16 +63,17 @@ class ZoomRecordings:
         enable_permission,
     ):
         """This method will iterate over list of users and will get all valid recording objects for the
-        active meeting ids. it will create a document from the returned data ready to be indexed.
+        active meeting ids. it will lazily yield a document created from the returned data ready to be indexed,
+        so that the caller can drain the documents without holding all of them in memory.
         :param users_data: list of dictionaries where each dictionary contains details fetched for a user from Zoom.
         :param recordings_schema: dictionary of fields to be indexed for meetings.
         :param start_time: datetime object for lower limit for data fetching.
         :param end_time: datetime object for upper limit for data fetching.
         :param enable_permission: boolean to check if permission sync is enabled or not.
-        :returns: dictionary containing type of data along with the data.
+        :yields: dictionary containing the recording document.
         """
         try:
-            recording_documents = []
+            recordings_count = 0
             # common_param will be common for all the recordings of one meeting.
             common_param = [
                 "host_id",
@@ -81,6 +83,18 @@ class ZoomRecordings:
                 "total_size",
                 "duration",
             ]
+            project_meeting = get_schema_projection(
+                {
+                    ws_field: zoom_fields
+                    for ws_field, zoom_fields in recordings_schema.items()
+                    if zoom_fields in common_param
+                }
+            )
+            recording_schema_items = [
+                (ws_field, zoom_fields)
+                for ws_field, zoom_fields in recordings_schema.items()
+                if zoom_fields not in common_param
+            ]
             for user in users_data:
                 self.logger.info(
                     f"Attempting to extract recordings for user {user['id']}."
@@ -91,6 +105,8 @@ class ZoomRecordings:
                     end_time.strftime(RFC_3339_DATETIME_FORMAT),
                 )
                 for meeting in recordings_list:
+                    common_document = project_meeting(meeting)
+                    url_encoded_uuid = url_encode(meeting["uuid"])
                     for recording in meeting["recording_files"]:
                         # skipping the recordings which are still in progress.
                         # skipped recordings will be indexed in the next execution.
@@ -99,21 +115,18 @@ class ZoomRecordings:
                         recording_document = {
                             "type": RECORDINGS,
                             "parent_id": user["id"],
+                            **common_document,
                         }
-                        for ws_field, zoom_fields in recordings_schema.items():
+                        for ws_field, zoom_fields in recording_schema_items:
                             if (recording["file_type"].upper() == "TIMELINE") and (
                                 ws_field == "url"
                             ):
                                 continue
-                            if zoom_fields in common_param:
-                                recording_document[ws_field] = meeting[zoom_fields]
-                                continue
                             recording_document[ws_field] = recording[zoom_fields]
                         recording_document["body"] = (
                             f"File MetaData\n File Type : {recording['file_type']}"
                             f"\n File Size : {recording['file_size']}\n Recording Type : {recording['recording_type']}"
                         )
-                        url_encoded_uuid = url_encode(meeting["uuid"])
                         recording_document[
                             "url"
                         ] = f"https://zoom.us/recording/management/detail?meeting_id={url_encoded_uuid}"
@@ -123,13 +136,13 @@ class ZoomRecordings:
                                 self.zoom_enterprise_search_mappings.get(user["id"], [])
                             )
                             recording_document["_allow_permissions"] = permission_list
-                        recording_documents.append(recording_document)
+                        recordings_count += 1
+                        yield recording_document
 
             self.logger.info(
-                f"Thread: [{threading.get_ident()}] {len(recording_documents)} number(s) of "
+                f"Thread: [{threading.get_ident()}] {recordings_count} number(s) of "
                 "Recordings documents generated."
             )
-            return {"type": RECORDINGS, "data": recording_documents}
         except KeyError as key_error_exception:
             self.logger.error(
                 f"Error {key_error_exception} occurred while generating recordings documents."
@@ -9,10 +9,20 @@ generate documents from fetched responses.
 """
 
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
-from .constant import ROLES
+from .constant import ROLES, ZOOM_MAX_PAGE_SIZE
+from .role_permissions_cache import (
+    FETCHED_AT_FIELD,
+    HAS_CHAT_ACCESS_FIELD,
+    RolePermissionsCache,
+)
+from .utils import get_schema_projection
 
 CHAT_MESSAGE_READ_PERMISSION = "ChatMessage:Read"
+ROLE_READ_PERMISSIONS = ("Role:Read",)
 
 
 class ZoomRoles:
@@ -29,6 +39,9 @@ class ZoomRoles:
         self.zoom_enterprise_search_mappings = zoom_enterprise_search_mappings
         self.roles_list = []
         self.retry_count = config.get_value("retry_count")
+        self.role_permissions_cache = RolePermissionsCache(logger)
+        self.role_permissions_cache_ttl = config.get_value("role_permissions_cache_ttl")
+        self.cached_role_permissions = {}
 
     def set_list_of_roles_from_zoom(self):
         """This function will fetch all the available roles from Zoom
@@ -58,23 +71,24 @@ class ZoomRoles:
         try:
             if not roles_data:
                 return {"type": ROLES, "data": []}
+            project_role = get_schema_projection(roles_schema)
             roles_count = 0
             roles_documents = []
             for role in roles_data:
-                role_document = {"type": ROLES}
-                for ws_field, zoom_fields in roles_schema.items():
-                    role_document[ws_field] = role[zoom_fields]
-                role_document["body"] = f"Total Members : {role['total_members']}"
-                role_document[
-                    "url"
-                ] = f"https://zoom.us/role#/detail/{role['id']}/settings"
+                role_document = {
+                    "type": ROLES,
+                    **project_role(role),
+                    "body": f"Total Members : {role['total_members']}",
+                    "url": f"https://zoom.us/role#/detail/{role['id']}/settings",
+                }
                 if enable_permission:
-                    permission_list = ["Role:Read"]
-                    role_document["_allow_permissions"] = permission_list
+                    role_document["_allow_permissions"] = ROLE_READ_PERMISSIONS
                 roles_documents.append(role_document)
                 roles_count += 1
             self.logger.info(
-                f"Thread: [{threading.get_ident()}] {roles_count} number(s) of roles documents generated."
+                "Thread: [%s] %s number(s) of roles documents generated.",
+                threading.get_ident(),
+                roles_count,
             )
             return {"type": ROLES, "data": roles_documents}
         except KeyError as key_error_exception:
@@ -84,21 +98,25 @@ class ZoomRoles:
             raise
 
     def fetch_role_permissions(self, role_id):
-        """This function will fetch all the permissions using role id.
+        """This function will fetch all the permissions using role id. The response is cached by the Zoom
+        client, so the permissions of a role are fetched only once per sync.
         :param role_id: string of the role ID.
         :returns: list of all the permissions enabled for role.
         """
         privileges_of_role = []
         try:
             privileges_of_role = self.zoom_client.get(
-                end_point=f"roles/{role_id}", key="privileges"
+                end_point=f"roles/{role_id}", key="privileges", use_cache=True
             )
         except Exception as exception:
             self.logger.error(
                 f"Unknown error ocurred while fetching roles permissions from Zoom: {exception}"
             )
         self.logger.info(
-            f"Thread: [{threading.get_ident()}] fetched : {len(privileges_of_role)} privileges for role id:{role_id}"
+            "Thread: [%s] fetched : %s privileges for role id:%s",
+            threading.get_ident(),
+            len(privileges_of_role),
+            role_id,
         )
         return privileges_of_role
 
@@ -107,33 +125,79 @@ class ZoomRoles:
         :param role_id: string of the role ID for which It has to fetch members.
         :returns: list of member_id having role as role_id.
         """
-        users_list = []
+        member_ids = []
         try:
-            users_list = self.zoom_client.get(
-                end_point=f"roles/{role_id}/members?page_size=300",
+            # only the ids are kept from each page instead of collecting the complete members response.
+            for members_page in self.zoom_client.iter_pages(
+                end_point=f"roles/{role_id}/members?page_size={ZOOM_MAX_PAGE_SIZE}",
                 key="members",
-                is_paginated=True,
-            )
+            ):
+                member_ids.extend(map(itemgetter("id"), members_page))
         except Exception as exception:
             self.logger.error(
                 f"Unknown error ocurred while fetching members from Zoom: {exception} For role id:{role_id}"
             )
-        member_ids = [member["id"] for member in users_list]
+            member_ids = []
         self.logger.info(
-            f"Thread: [{threading.get_ident()}] fetched : {len(users_list)} members for role id:{role_id} ."
+            "Thread: [%s] fetched : %s members for role id:%s .",
+            threading.get_ident(),
+            len(member_ids),
+            role_id,
         )
         return member_ids
 
+    def has_chat_access(self, role_id):
+        """Function checks if the role has read access for chat messages. The result cached by a previous
+        sync is used until it expires, otherwise the permissions of the role are fetched from Zoom.
+        Nothing is cached when role_permissions_cache_ttl is 0.
+        :param role_id: string of the role ID.
+        :returns: boolean representing if the role has read access for chat messages.
+        """
+        cached_role = self.cached_role_permissions.get(role_id)
+        if cached_role and time.time() - cached_role[FETCHED_AT_FIELD] < self.role_permissions_cache_ttl:
+            return cached_role[HAS_CHAT_ACCESS_FIELD]
+        privileges_of_role = self.fetch_role_permissions(role_id)
+        has_chat_access = CHAT_MESSAGE_READ_PERMISSION in privileges_of_role
+        # an empty list is also returned when the permissions could not be fetched, hence it is not cached.
+        if privileges_of_role and self.role_permissions_cache_ttl:
+            self.cached_role_permissions[role_id] = {
+                HAS_CHAT_ACCESS_FIELD: has_chat_access,
+                FETCHED_AT_FIELD: time.time(),
+            }
+        return has_chat_access
+
+    def fetch_members_of_role_with_chat_access(self, role_id):
+        """Function fetches members of the role only if the role has read access for chat messages.
+        :param role_id: string of the role ID for which It has to fetch members.
+        :returns: list of member_id having role as role_id or an empty list if the role has no chat access.
+        """
+        if self.has_chat_access(role_id):
+            return self.fetch_members_of_role(role_id)
+        return []
+
     def fetch_user_ids_with_chat_access(self):
         """This method will fetch the userID of users having read access for chat messages.
         :returns: list containing userIDs of users having read access for chat messages.
         """
         self.set_list_of_roles_from_zoom()
+        roles_ids = [role["id"] for role in self.roles_list]
+        if self.role_permissions_cache_ttl:
+            cached_role_permissions = self.role_permissions_cache.get_cache()
+            # entries of the roles deleted from Zoom are dropped from the cache.
+            self.cached_role_permissions = {
+                role_id: cached_role_permissions[role_id]
+                for role_id in roles_ids
+                if role_id in cached_role_permissions
+            }
         chat_permission_users_list = []
-        for role in self.roles_list:
-            role_permissions = self.fetch_role_permissions(role["id"])
-            role_members_ids = self.fetch_members_of_role(role["id"])
-            for role_permission in role_permissions:
-                if role_permission == CHAT_MESSAGE_READ_PERMISSION:
-                    chat_permission_users_list.extend(role_members_ids)
+        # roles are processed in parallel and members are fetched only for the roles having chat access.
+        with ThreadPoolExecutor(
+            max_workers=self.config.get_value("zoom_sync_thread_count")
+        ) as executor:
+            for role_members_ids in executor.map(
+                self.fetch_members_of_role_with_chat_access, roles_ids
+            ):
+                chat_permission_users_list.extend(role_members_ids)
+        if self.role_permissions_cache_ttl:
+            self.role_permissions_cache.set_cache(self.cached_role_permissions)
         return chat_permission_users_list
@@ -6,10 +6,17 @@
 """This module will fetch users details for each user present in
 the Zoom Server and will create documents from the fetched responses.
 """
-import datetime
 import threading
+from operator import itemgetter
 
-from .constant import RFC_3339_DATETIME_FORMAT, USERS
+from .constant import RFC_3339_DATETIME_FORMAT, USERS, ZOOM_MAX_PAGE_SIZE
+from .utils import get_schema_projection
+
+USER_BODY_FIELDS = ("first_name", "last_name", "status", "role_id", "email")
+get_user_body_fields = itemgetter(*USER_BODY_FIELDS)
+# shared by the documents of all the users without mapped enterprise search users.
+USER_READ_PERMISSIONS = ("User:Read",)
+USERS_END_POINT = f"users?page_size={ZOOM_MAX_PAGE_SIZE}"
 
 
 class ZoomUsers:
@@ -26,21 +33,20 @@ class ZoomUsers:
         self.zoom_enterprise_search_mappings = zoom_enterprise_search_mappings
         self.retry_count = config.get_value("retry_count")
 
-    def get_users_list(self):
-        """The method will fetch all the available users from Zoom
-        :returns users_list: list of total users fetched from Zoom
+    def iter_users(self):
+        """The method will lazily fetch all the available users from Zoom page by page
+        :yields user: dictionary containing details fetched for a user from Zoom
         """
-        users_list = []
         try:
-            users_list = self.zoom_client.get(
-                end_point="users?page_size=300", key=USERS, is_paginated=True
-            )
+            for users_page in self.zoom_client.iter_pages(
+                end_point=USERS_END_POINT, key=USERS
+            ):
+                yield from users_page
         except Exception as exception:
             self.logger.exception(
                 f"Unknown error occurred while fetching users from Zoom. : {exception}"
             )
             raise exception
-        return users_list
 
     def get_users_details_documents(
         self,
@@ -59,32 +65,39 @@ class ZoomUsers:
         :returns: dictionary containing type of data along with the data.
         """
         try:
+            project_user = get_schema_projection(users_schema)
+            get_mapped_permissions = self.zoom_enterprise_search_mappings.get
+            # datetime strings in RFC 3339 format are lexicographically sortable, hence compared without parsing.
+            start_time_string = start_time.strftime(RFC_3339_DATETIME_FORMAT)
+            end_time_string = end_time.strftime(RFC_3339_DATETIME_FORMAT)
             count = 0
             user_documents = []
             for user in users_data:
-                user_created_at = datetime.datetime.strptime(
-                    user["created_at"], RFC_3339_DATETIME_FORMAT
-                )
-                if user_created_at >= start_time and user_created_at <= end_time:
-                    user_document = {"type": USERS}
-                    for ws_field, zoom_fields in users_schema.items():
-                        user_document[ws_field] = user[zoom_fields]
-                    user_document["body"] = (
-                        f"First Name : {user['first_name']}\nLast Name : {user['last_name']}\n"
-                        f"Status : {user['status']}\n"
-                        f"Role Id : {user['role_id']}\nEmail : {user['email']}"
-                    )
-                    user_document["url"] = f"https://zoom.us/user/{user['id']}/profile"
+                if start_time_string <= user["created_at"] <= end_time_string:
+                    first_name, last_name, status, role_id, email = get_user_body_fields(user)
+                    user_document = {
+                        "type": USERS,
+                        **project_user(user),
+                        "body": (
+                            f"First Name : {first_name}\nLast Name : {last_name}\n"
+                            f"Status : {status}\n"
+                            f"Role Id : {role_id}\nEmail : {email}"
+                        ),
+                        "url": f"https://zoom.us/user/{user['id']}/profile",
+                    }
                     if enable_permission:
-                        permission_list = ["User:Read"]
-                        permission_list.extend(
-                            self.zoom_enterprise_search_mappings.get(user["id"], [])
+                        mapped_permissions = get_mapped_permissions(user["id"])
+                        user_document["_allow_permissions"] = (
+                            (*USER_READ_PERMISSIONS, *mapped_permissions)
+                            if mapped_permissions
+                            else USER_READ_PERMISSIONS
                         )
-                        user_document["_allow_permissions"] = permission_list
                     user_documents.append(user_document)
                     count += 1
             self.logger.info(
-                f"Thread: [{threading.get_ident()}] {count} number(s) of Users documents generated."
+                "Thread: [%s] %s number(s) of Users documents generated.",
+                threading.get_ident(),
+                count,
             )
             return {"type": USERS, "data": user_documents}
         except KeyError as key_error_exception:
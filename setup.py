@@ -19,6 +19,7 @@ install_requires = [
     "elastic_enterprise_search",
     "flake8",
     "iteration_utilities",
+    "orjson",
     "pytest",
     "pytest-cov",
     "pytest-custom_exit_code",
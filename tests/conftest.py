@@ -0,0 +1,128 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+import socket
+import time
+
+import pytest
+
+from ees_zoom import (checkpointing, local_storage, role_permissions_cache,
+                      secrets_storage)
+from ees_zoom import zoom_client as zoom_client_module
+from ees_zoom.zoom_client import ZoomClient
+from support import get_test_logger, load_configuration
+
+
+def pytest_addoption(parser):
+    """Adds the --max-test-duration option failing the tests whose call phase runs longer than the given seconds.
+    :param parser: parser of the pytest command line options
+    """
+    parser.addoption(
+        "--max-test-duration",
+        type=float,
+        default=None,
+        help="fail the tests running longer than this number of seconds",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Fails a passing test when its call phase ran longer than the --max-test-duration option, so that a
+    regression of the slowest tests fails the build.
+    :param item: test item being reported
+    :param call: call information of the reported phase
+    """
+    outcome = yield
+    report = outcome.get_result()
+    max_test_duration = item.config.getoption("max_test_duration")
+    if max_test_duration is not None and report.when == "call" and report.passed and report.duration > max_test_duration:
+        report.outcome = "failed"
+        report.longrepr = f"The test ran for {report.duration:.2f} seconds, above the {max_test_duration} seconds threshold."
+
+
+@pytest.fixture(scope="session")
+def base_configuration():
+    """This fixture parses the configuration file once for the whole test session.
+    :returns configuration: Configuration instance
+    """
+    return load_configuration()
+
+
+@pytest.fixture(scope="module")
+def module_zoom_client(base_configuration):
+    """This fixture creates the Zoom client shared by the tests of a module.
+    :param base_configuration: Configuration instance shared by the test session.
+    :returns ZoomClient: Instance of ZoomClient.
+    """
+    return ZoomClient(base_configuration, get_test_logger("unit_test_zoom_client"))
+
+
+@pytest.fixture
+def zoom_client(module_zoom_client):
+    """This fixture gives the Zoom client shared by the tests of the module a valid access token for the test,
+    the token and the cached Zoom responses are dropped once the test is done.
+    :param module_zoom_client: Instance of ZoomClient shared by the tests of the module.
+    :returns ZoomClient: Instance of ZoomClient with a valid access token.
+    """
+    module_zoom_client.access_token = "dummy"
+    module_zoom_client.access_token_expiration = time.time() + 4000
+    yield module_zoom_client
+    module_zoom_client.access_token = None
+    module_zoom_client.access_token_expiration = time.time()
+    module_zoom_client.clear_response_cache()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_local_storage(tmp_path_factory):
+    """Points the checkpoint, the doc ids storage, the role permissions cache and the secrets storage files
+    to a temporary directory of the test session. The tests neither leave files in the ees_zoom package nor
+    race on them when they are distributed with pytest-xdist, as every worker gets its own directory.
+    :param tmp_path_factory: fixture creating the temporary directory of the test session.
+    """
+    storage_directory = tmp_path_factory.mktemp("local_storage")
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(checkpointing, "CHECKPOINT_PATH", str(storage_directory / "checkpoint.json"))
+    monkeypatch.setattr(local_storage, "IDS_PATH", str(storage_directory / "doc_id.json"))
+    monkeypatch.setattr(
+        role_permissions_cache,
+        "ROLE_PERMISSIONS_CACHE_PATH",
+        str(storage_directory / "role_permissions_cache.json"),
+    )
+    monkeypatch.setattr(secrets_storage, "SECRETS_JSON_PATH", str(storage_directory / "secrets.json"))
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def disable_network():
+    """Fails any test trying to reach a real host, every HTTP call of the tests must be mocked."""
+    connect = socket.socket.connect
+
+    def guarded_getaddrinfo(host, *args, **kwargs):
+        raise RuntimeError(f"The tests must not reach a real host, attempted to resolve {host}")
+
+    def guarded_connect(sock, address):
+        if sock.family == socket.AF_UNIX:
+            return connect(sock, address)
+        raise RuntimeError(f"The tests must not reach a real host, attempted connection to {address}")
+
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(socket, "getaddrinfo", guarded_getaddrinfo)
+    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_zoom_session():
+    """Every ZoomClient created by the tests uses the same requests session, so the HTTP adapters are
+    mounted once for the whole test session.
+    """
+    session = zoom_client_module.create_session()
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(zoom_client_module, "create_session", lambda: session)
+    yield
+    monkeypatch.undo()
+    session.close()
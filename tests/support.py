@@ -3,16 +3,51 @@
 # or more contributor license agreements. Licensed under the Elastic License 2.0;
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
+import json
+import logging
 import os
-import sys
 from collections import namedtuple
+from functools import lru_cache
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom.configuration import Configuration
+from ees_zoom.connector_queue import ConnectorQueue
 
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+AUTH_BASE_URL = "https://zoom.us/oauth/token?grant_type="
+
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), "config", "zoom_connector.yml")
+
+ZOOM_ENTERPRISE_SEARCH_MAPPINGS = {
+    "dummy_id_1": ["ent_dummy_id_1", "ent_dummy_id_1_2"],
+    "dummy_id_2": ["ent_dummy_id_2"],
+}
+
+DELETE_DOCUMENTS_CASES = [
+    (
+        ["844424930334011", "543528180028451862"],
+        {
+            "global_keys": [
+                {"id": "844424930334011"},
+                {"id": "543528180028451862"},
+            ],
+            "delete_keys": [
+                {"id": "844424930334011"},
+                {"id": "543528180028451862"},
+            ],
+        },
+        {
+            "global_keys": [],
+            "delete_keys": [
+                {"id": "844424930334011"},
+                {"id": "543528180028451862"},
+            ],
+        },
+    )
+]
 
 
 def get_args(command_name, *args):
@@ -24,3 +59,63 @@ def get_args(command_name, *args):
 
     args.config_file = CONFIG_FILE
     return args
+
+
+def dump_json(obj):
+    """Serializes the object to JSON encoded bytes, the same type as the content of a HTTP response.
+    orjson is used when it is installed, the standard json module otherwise.
+    :param obj: object to serialize
+    :returns content: JSON encoded bytes
+    """
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def get_test_logger(name):
+    """Returns the logger of a test module. The logger does not propagate its records to the root logger,
+    so the many records emitted by the mocked code paths are not formatted and dispatched to the pytest
+    logging handlers.
+    :param name: name of the logger
+    :returns logger: Logger instance
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+        logger.propagate = False
+    return logger
+
+
+@lru_cache(maxsize=1)
+def load_configuration():
+    """Loads the test configuration file once, the returned Configuration is shared by the tests
+    and must not be modified.
+    :returns configuration: Configuration instance
+    """
+    return Configuration(file_name=CONFIG_FILE)
+
+
+class InMemoryConnectorQueue(ConnectorQueue):
+    """ConnectorQueue which keeps the documents in memory, so that the tests producing and consuming in a
+    single process do not create the pipe and the feeder thread of a multiprocessing queue.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.items = []
+
+    def put(self, obj, block=True, timeout=None):
+        """Appends the object to the in memory list of queued objects"""
+        self.items.append(obj)
+
+    def get(self, block=True, timeout=None):
+        """Removes and returns the oldest queued object"""
+        return self.items.pop(0)
+
+    def qsize(self):
+        """Returns the number of queued objects"""
+        return len(self.items)
+
+    def empty(self):
+        """Returns True if no object is queued"""
+        return not self.items
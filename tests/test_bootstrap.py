@@ -5,17 +5,10 @@
 #
 
 import argparse
-import os
-import sys
 from unittest.mock import Mock
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from ees_zoom.bootstrap_command import BootstrapCommand  # noqa
-
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
+from ees_zoom.bootstrap_command import BootstrapCommand
+from support import CONFIG_FILE
 
 
 def test_execute(caplog):
@@ -32,7 +25,7 @@ def test_execute(caplog):
         return_value=mock_response
     )
     bootstrap_obj.execute()
-    assert "Created ContentSource with ID 1234." in caplog.text
+    assert any("Created ContentSource with ID 1234." in record.getMessage() for record in caplog.records)
 
 
 def test_execute_with_user_argument(caplog):
@@ -49,4 +42,4 @@ def test_execute_with_user_argument(caplog):
         return_value=mock_response
     )
     bootstrap_obj.execute()
-    assert "Created ContentSource with ID 1234." in caplog.text
+    assert any("Created ContentSource with ID 1234." in record.getMessage() for record in caplog.records)
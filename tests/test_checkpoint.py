@@ -6,51 +6,52 @@
 
 import datetime
 import json
-import logging
-import os
-import sys
 
 import pytest
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from ees_zoom.checkpointing import Checkpoint  # noqa
-from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.constant import RFC_3339_DATETIME_FORMAT  # noqa
+from ees_zoom import checkpointing
+from ees_zoom.checkpointing import Checkpoint
+from ees_zoom.constant import RFC_3339_DATETIME_FORMAT
+from support import get_test_logger, load_configuration
 
-CHECKPOINT_PATH = os.path.join(
-    os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
-    "ees_zoom",
-    "checkpoint.json",
-)
+logger = get_test_logger("unit_test_checkpointing")
 
 
 def settings():
-    """This function loads configuration from the file and initialize logger.
+    """This function returns the configuration shared by the tests and the logger.
     :returns configuration: Configuration instance
     :returns logger: Logger instance
     """
-    configuration = Configuration(
-        os.path.join(
-            os.path.join(os.path.dirname(__file__), "config"),
-            "zoom_connector.yml",
-        )
-    )
-
-    logger = logging.getLogger("unit_test_checkpointing")
+    configuration = load_configuration()
     return configuration, logger
 
 
-def test_set_checkpoint_when_checkpoint_file_available():
-    """Test set current time in checkpoint.json file when checkpoint.json file is available."""
+@pytest.fixture
+def checkpoint_path(tmp_path, monkeypatch):
+    """This fixture points the checkpoint to a file in the temporary directory of the test, so that every test
+    starts without a checkpoint file.
+    :param tmp_path: fixture for the temporary directory of the test.
+    :param monkeypatch: fixture for patching the path of the checkpoint file.
+    :returns checkpoint_path: path of the checkpoint file
+    """
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    monkeypatch.setattr(checkpointing, "CHECKPOINT_PATH", checkpoint_path)
+    return checkpoint_path
+
+
+def test_set_checkpoint_when_checkpoint_file_available(checkpoint_path):
+    """Test set current time in checkpoint.json file when checkpoint.json file is available.
+    :param checkpoint_path: path of the checkpoint file.
+    """
     configs, logger = settings()
     checkpoint_obj = Checkpoint(configs, logger)
     current_time = datetime.datetime.utcnow()
     current_time_strf = (current_time).strftime(RFC_3339_DATETIME_FORMAT)
     dummy_object_type = {"dummy": (current_time).strftime(RFC_3339_DATETIME_FORMAT)}
-    with open(CHECKPOINT_PATH, "w", encoding="UTF-8") as outfile:
+    with open(checkpoint_path, "w", encoding="UTF-8") as outfile:
         json.dump(dummy_object_type, outfile, indent=4)
     checkpoint_obj.set_checkpoint(current_time_strf, "incremental", "dummy")
-    with open(CHECKPOINT_PATH, encoding="UTF-8") as checkpoint_store:
+    with open(checkpoint_path, encoding="UTF-8") as checkpoint_store:
         checkpoint_list = json.load(checkpoint_store)
     assert checkpoint_list["dummy"] == current_time_strf
 
@@ -71,36 +72,39 @@ def test_set_checkpoint_when_checkpoint_file_available():
             "dummy",
         ),
     ],
+    ids=["incremental", "full_sync"],
 )
 def test_set_checkpoint_when_checkpoint_file_not_available(
-    index_type, expected_time, current_time, obj_type
+    checkpoint_path, monkeypatch, index_type, expected_time, current_time, obj_type
 ):
     """Test set correct time in checkpoint.json file when checkpoint.json file is not available.
+    :param checkpoint_path: path of the absent checkpoint file.
+    :param monkeypatch: fixture for setting the end_time of the shared configuration for the test only.
     :param index_type: Incremental or Full-sync Indexing.
     :param expected_time: expected time value when checkpoint file is not available.
     :param obj_type: object name for which checkpoint will be fetch.
     """
     configs, logger = settings()
     checkpoint_obj = Checkpoint(configs, logger)
-    checkpoint_obj.config._Configuration__configurations["end_time"] = expected_time
-    if os.path.exists(CHECKPOINT_PATH):
-        os.remove(CHECKPOINT_PATH)
+    monkeypatch.setitem(checkpoint_obj.config._Configuration__configurations, "end_time", expected_time)
 
     checkpoint_obj.set_checkpoint(current_time, index_type, obj_type)
-    with open(CHECKPOINT_PATH, encoding="UTF-8") as checkpoint_store:
+    with open(checkpoint_path, encoding="UTF-8") as checkpoint_store:
         checkpoint_list = json.load(checkpoint_store)
     assert checkpoint_list[obj_type] == expected_time
 
 
-def test_get_checkpoint_when_checkpoint_file_available():
-    """Test that get checkpoint details from checkpoint.json file when checkpoint.json file is available."""
+def test_get_checkpoint_when_checkpoint_file_available(checkpoint_path):
+    """Test that get checkpoint details from checkpoint.json file when checkpoint.json file is available.
+    :param checkpoint_path: path of the checkpoint file.
+    """
     configs, logger = settings()
     checkpoint_obj = Checkpoint(configs, logger)
     checkpoint_time = (
         datetime.datetime.utcnow() - datetime.timedelta(days=3)
     ).strftime(RFC_3339_DATETIME_FORMAT)
     dummy_object_type = {"dummy": checkpoint_time}
-    with open(CHECKPOINT_PATH, "w", encoding="UTF-8") as outfile:
+    with open(checkpoint_path, "w", encoding="UTF-8") as outfile:
         json.dump(dummy_object_type, outfile, indent=4)
     current_time = (datetime.datetime.utcnow()).strftime(RFC_3339_DATETIME_FORMAT)
     start_time, end_time = checkpoint_obj.get_checkpoint(current_time, "dummy")
@@ -4,473 +4,206 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 import argparse
+import copy
 import logging
-import os
-import sys
-from unittest.mock import MagicMock, Mock, patch
+import re
+from unittest.mock import patch
 
 import pytest
+import requests_mock
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.sync_zoom import SyncZoom  # noqa
-from ees_zoom.deletion_sync_command import DeletionSyncCommand  # noqa
-from ees_zoom.zoom_client import ZoomClient  # noqa
-from support import get_args  # noqa
+from ees_zoom import base_command
+from ees_zoom.sync_zoom import SyncZoom
+from ees_zoom.deletion_sync_command import DeletionSyncCommand
+from support import CONFIG_FILE, DELETE_DOCUMENTS_CASES, dump_json
 
 USERS = "users"
+ROLES = "roles"
 MEETINGS = "meetings"
 GROUPS = "groups"
 CHANNELS = "channels"
-AUTH_BASE_URL = "https://zoom.us/oauth/token?grant_type="
-
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
+ZOOM_OBJECT_URL_PATTERN = re.compile(
+    r"https://api\.zoom\.us/v2/(users|groups|meetings|roles|past_meetings)/\d+"
 )
 
-SECRETS_JSON_PATH = os.path.join(
-    os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
-    "ees_zoom",
-    "secrets.json",
-)
+
+@pytest.fixture(scope="module", autouse=True)
+def disable_logger():
+    """Disables the logger of the deletion sync command, so that no log record is created and handled
+    while the tests run. Nothing in this module asserts on the logs.
+    """
+    logger = logging.getLogger(base_command.__name__)
+    logger.disabled = True
+    yield
+    logger.disabled = False
+
+
+@pytest.fixture(scope="module")
+def zoom_api_responses():
+    """This fixture holds the status code and encoded json response of the mocked Zoom API for each object type,
+    tests set the responses they expect for the object types they query.
+    :returns zoom_api_responses: dictionary with object type as key and tuple of status code and encoded json
+    as value.
+    """
+    return {}
 
 
-def settings(requests_mock):
-    """This function loads configuration from the file and returns it,
-    it also mocks the zoom refresh token generation API response.
-    :param requests_mock: fixture for requests.get calls.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
+@pytest.fixture(scope="module")
+def zoom_requests_mock(zoom_api_responses):
+    """This fixture registers a single matcher for the Zoom object APIs once for the module.
+    :param zoom_api_responses: dictionary of the mocked Zoom API responses per object type.
+    :yields mocker: requests_mock Mocker instance
     """
-    configuration = Configuration(file_name=CONFIG_FILE)
-    if os.path.exists(SECRETS_JSON_PATH):
-        os.remove(SECRETS_JSON_PATH)
-    logger = logging.getLogger("unit_test_deletion_sync")
-    new_refresh_token = "new_dummy_refresh_token"
-    access_token = "dummy_access_token"
-    json_response = {"refresh_token": new_refresh_token, "access_token": access_token}
-    zoom_client_object = ZoomClient(configuration, logger)
-    zoom_client_object.secrets_storage.get_secrets = MagicMock(return_value=None)
-    url = (
-        f"{AUTH_BASE_URL}"
-        f"authorization_code&code={zoom_client_object.authorization_code}"
-        f"&redirect_uri={zoom_client_object.redirect_uri}"
-    )
-    headers = zoom_client_object.get_headers()
-    requests_mock.post(
-        url,
-        headers=headers,
-        json=json_response,
-        status_code=200,
-    )
-    return configuration, logger
+
+    def get_zoom_api_response(request, context):
+        """Returns the encoded json response set by the test for the object type of the requested url."""
+        object_type = ZOOM_OBJECT_URL_PATTERN.match(request.url).group(1)
+        context.status_code, content = zoom_api_responses[object_type]
+        return content
+
+    with requests_mock.Mocker() as mocker:
+        mocker.get(
+            ZOOM_OBJECT_URL_PATTERN,
+            content=get_zoom_api_response,
+            headers={"content-type": "application/json"},
+        )
+        yield mocker
+
+
+@pytest.fixture(scope="module")
+def deletion_sync_obj(zoom_requests_mock):
+    """This fixture creates a DeletionSyncCommand once for the module. The access token is set directly,
+    so no token is generated or stored while the tests run.
+    :param zoom_requests_mock: module scoped mocker with the Zoom object APIs responses.
+    :returns deletion_sync_obj: DeletionSyncCommand instance
+    """
+    args = argparse.Namespace()
+    args.config_file = CONFIG_FILE
+    deletion_sync_obj = DeletionSyncCommand(args)
+    deletion_sync_obj.zoom_client.ensure_token_valid = lambda: None
+    deletion_sync_obj.zoom_client.access_token = "dummy_access_token"
+    return deletion_sync_obj
+
+
+@pytest.fixture(autouse=True)
+def reset_deletion_sync_obj(deletion_sync_obj, zoom_api_responses):
+    """Resets the state collected by the shared DeletionSyncCommand and the Zoom API responses set in
+    the previous test.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
+    :param zoom_api_responses: dictionary of the mocked Zoom API responses per object type.
+    """
+    deletion_sync_obj.global_deletion_ids = []
+    deletion_sync_obj.zoom_client.clear_response_cache()
+    zoom_api_responses.clear()
 
 
 @pytest.mark.parametrize(
     "deleted_ids, storage_with_collection, updated_storage_with_collection",
-    [
-        (
-            ["844424930334011", "543528180028451862"],
-            {
-                "global_keys": [
-                    {"id": "844424930334011"},
-                    {"id": "543528180028451862"}
-                ],
-                "delete_keys": [
-                    {"id": "844424930334011"},
-                    {"id": "543528180028451862"}
-                ]
-            },
-            {
-                "global_keys": [],
-                "delete_keys": [
-                    {"id": "844424930334011"},
-                    {"id": "543528180028451862"}
-                ]
-            }
-        )
-    ],
+    DELETE_DOCUMENTS_CASES,
 )
 def test_delete_documents(
-    requests_mock,
+    deletion_sync_obj,
     deleted_ids,
     storage_with_collection,
     updated_storage_with_collection,
 ):
     """Test that deletion_sync_command deletes objects from Enterprise Search.
-    :param requests_mock: fixture for requests.get calls.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
     :param deleted_ids: list of deleted documents ids from zoom.
     :param storage_with_collection: objects documents dictionary.
     :param updated_storage_with_collection: updated objects documents dictionary.
     """
     # Setup
-    _, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    deletion_sync_obj.workplace_search_client.delete_documents = Mock()
-    deletion_sync_obj.zoom_client.ensure_token_valid()
+    deleted_ids = list(deleted_ids)
+    storage_with_collection = copy.deepcopy(storage_with_collection)
+    deletion_sync_obj.workplace_search_client.delete_documents = lambda *args, **kwargs: None
 
     # Execute and assert
     assert deletion_sync_obj.delete_documents(deleted_ids, storage_with_collection) == updated_storage_with_collection
 
 
 @pytest.mark.parametrize(
-    "user_id_list, deletion_response",
+    "object_type, status_code, deletion_response, expected_deletion_ids",
     [
         (
+            USERS,
+            404,
+            dump_json({"code": 1001, "message": "User does not exist: 844424930334011."}),
             ["844424930334011"],
-            {"code": 1001, "message": "User does not exist: 844424930334011."},
-        )
-    ],
-)
-def test_collect_deleted_ids_for_users_positive(
-    requests_mock,
-    user_id_list,
-    deletion_response,
-):
-    """Test that deletion_sync_command deletes users object from Enterprise Search.
-    :param requests_mock: fixture for requests.get calls.
-    :param user_id_list: list of user_id deleted from zoom.
-    :param deletion_response: dictionary of mocked api response.
-    """
-    # Setup
-    _, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/users/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=404,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
-
-    # Execute
-    deletion_sync_obj.collect_deleted_ids(user_id_list, USERS)
-
-    # Assert
-    assert user_id_list == deletion_sync_obj.global_deletion_ids
-
-
-@pytest.mark.parametrize(
-    "user_id_list, deletion_response",
-    [
+        ),
         (
-            ["844424930334011"],
-            {
-                "id": "844424930334011",
-                "type": "users",
-            },
-        )
-    ],
-)
-def test_collect_deleted_ids_for_users_negative(
-    requests_mock,
-    user_id_list,
-    deletion_response,
-):
-    """Test that deletion_sync_command won't delete users object from Enterprise Search if it exist in Zoom.
-    :param requests_mock: fixture for requests.get calls.
-    :param user_id_list: list of user_id deleted from zoom.
-    :param deletion_response: dictionary of mocked api response.
-    """
-    # Setup
-    config, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/users/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=200,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
-
-    # Execute
-    deletion_sync_obj.collect_deleted_ids(user_id_list, USERS)
-
-    # Assert
-    assert [] == deletion_sync_obj.global_deletion_ids
-
-
-@pytest.mark.parametrize(
-    "role_id_list, deletion_response",
-    [
+            USERS,
+            200,
+            dump_json({"id": "844424930334011", "type": "users"}),
+            [],
+        ),
         (
+            ROLES,
+            400,
+            dump_json({"code": 1001, "message": "Role does not exist: 844424930334011."}),
             ["844424930334011"],
-            {"code": 1001, "message": "Role does not exist: 844424930334011."},
-        )
-    ],
-)
-def test_collect_deleted_roles_ids_positive(
-    requests_mock,
-    role_id_list,
-    deletion_response,
-):
-    """Test that deletion_sync_command deletes roles object from Enterprise Search.
-    :param requests_mock: fixture for requests.get calls.
-    :param role_id_list: list of role_id deleted from zoom.
-    :param deletion_response: dictionary of mocked api response.
-    """
-    # Setup
-    _, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/roles/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=400,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
-
-    # Execute
-    deletion_sync_obj.collect_deleted_roles_ids(role_id_list)
-
-    # Assert
-    assert role_id_list == deletion_sync_obj.global_deletion_ids
-
-
-@pytest.mark.parametrize(
-    "role_id_list, deletion_response",
-    [
+        ),
         (
-            ["844424930334011"],
-            {
-                "id": "844424930334011",
-                "type": "roles",
-            },
-        )
-    ],
-)
-def test_collect_deleted_roles_ids_negative(
-    requests_mock,
-    role_id_list,
-    deletion_response,
-):
-    """Test that deletion_sync_command won't delete roles object from Enterprise Search if it exist in Zoom.
-    :param requests_mock: fixture for requests.get calls.
-    :param role_id_list: list of role_id deleted from zoom.
-    :param deletion_response: dictionary of mocked api response.
-    """
-    # Setup
-    _, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/roles/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=200,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
-
-    # Execute
-    deletion_sync_obj.collect_deleted_roles_ids(role_id_list)
-
-    # Assert
-    assert [] == deletion_sync_obj.global_deletion_ids
-
-
-@pytest.mark.parametrize(
-    "group_id_list, deletion_response",
-    [
+            ROLES,
+            200,
+            dump_json({"id": "844424930334011", "type": "roles"}),
+            [],
+        ),
         (
+            GROUPS,
+            404,
+            dump_json({"code": 1001, "message": "Group does not exist: 844424930334011."}),
             ["844424930334011"],
-            {"code": 1001, "message": "Group does not exist: 844424930334011."},
-        )
-    ],
-)
-def test_collect_deleted_ids_for_groups_positive(
-    requests_mock,
-    group_id_list,
-    deletion_response,
-):
-    """Test that deletion_sync_command deletes groups object from Enterprise Search.
-    :param requests_mock: fixture for requests.get calls.
-    :param group_id_list: list of group_id deleted from zoom.
-    :param deletion_response: dictionary of mocked api response.
-    """
-    # Setup
-    config, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/groups/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=404,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
-
-    # Execute
-    deletion_sync_obj.collect_deleted_ids(group_id_list, GROUPS)
-
-    # Assert
-    assert group_id_list == deletion_sync_obj.global_deletion_ids
-
-
-@pytest.mark.parametrize(
-    "group_id_list, deletion_response",
-    [
+        ),
         (
-            ["844424930334011"],
-            {
-                "id": "844424930334011",
-                "type": "groups",
-            },
-        )
-    ],
-)
-def test_collect_deleted_ids_for_groups_negative(
-    requests_mock,
-    group_id_list,
-    deletion_response,
-):
-    """Test that deletion_sync_command won't delete groups object from Enterprise Search if it exist in Zoom.
-    :param requests_mock: fixture for requests.get calls.
-    :param group_id_list: list of group_id deleted from zoom.
-    :param deletion_response: dictionary of mocked api response.
-    """
-    # Setup
-    _, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/groups/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=200,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
-
-    # Execute
-    deletion_sync_obj.collect_deleted_ids(group_id_list, GROUPS)
-
-    # Assert
-    assert [] == deletion_sync_obj.global_deletion_ids
-
-
-@pytest.mark.parametrize(
-    "meeting_id_list, deletion_response",
-    [
+            GROUPS,
+            200,
+            dump_json({"id": "844424930334011", "type": "groups"}),
+            [],
+        ),
         (
+            MEETINGS,
+            404,
+            dump_json({"code": 1001, "message": "Meeting does not exist: 844424930334011."}),
             ["844424930334011"],
-            {"code": 1001, "message": "Meeting does not exist: 844424930334011."},
-        )
-    ],
-)
-def test_collect_deleted_ids_for_meetings_positive(
-    requests_mock,
-    meeting_id_list,
-    deletion_response,
-):
-    """Test that deletion_sync_command deletes meetings object from Enterprise Search.
-    :param requests_mock: fixture for requests.get calls.
-    :param meeting_id_list: list of meeting_id deleted from zoom.
-    :param deletion_response: dictionary of mocked api response.
-    """
-    # Setup
-    config, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/meetings/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=404,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
-
-    # Execute
-    deletion_sync_obj.collect_deleted_ids(meeting_id_list, MEETINGS)
-
-    # Assert
-    assert meeting_id_list == deletion_sync_obj.global_deletion_ids
-
-
-@pytest.mark.parametrize(
-    "meeting_id_list, deletion_response",
-    [
+        ),
         (
-            ["844424930334011"],
-            {
-                "id": "844424930334011",
-                "type": "meetings",
-            },
-        )
+            MEETINGS,
+            200,
+            dump_json({"id": "844424930334011", "type": "meetings"}),
+            [],
+        ),
     ],
 )
-def test_collect_deleted_ids_for_meetings_negative(
-    requests_mock,
-    meeting_id_list,
+def test_collect_deleted_ids(
+    zoom_api_responses,
+    deletion_sync_obj,
+    object_type,
+    status_code,
     deletion_response,
+    expected_deletion_ids,
 ):
-    """Test that deletion_sync_command won't delete meetings object from Enterprise Search if it exist in Zoom.
-    :param requests_mock: fixture for requests.get calls.
-    :param meeting_id_list: list of meeting_id deleted from zoom.
-    :param deletion_response: dictionary of mocked api response.
+    """Test that deletion_sync_command deletes users, roles, groups and meetings objects from Enterprise Search
+    only if they do not exist in Zoom.
+    :param zoom_api_responses: dictionary of the mocked Zoom API responses per object type.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
+    :param object_type: type of the object to check in Zoom.
+    :param status_code: status code of the mocked api response.
+    :param deletion_response: encoded json of the mocked api response.
+    :param expected_deletion_ids: list of ids expected to be deleted from Enterprise Search.
     """
     # Setup
-    _, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/meetings/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=200,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
+    object_id_list = ["844424930334011"]
+    zoom_api_responses[object_type] = (status_code, deletion_response)
 
     # Execute
-    deletion_sync_obj.collect_deleted_ids(meeting_id_list, MEETINGS)
+    if object_type == ROLES:
+        deletion_sync_obj.collect_deleted_roles_ids(object_id_list)
+    else:
+        deletion_sync_obj.collect_deleted_ids(object_id_list, object_type)
 
     # Assert
-    assert [] == deletion_sync_obj.global_deletion_ids
+    assert expected_deletion_ids == deletion_sync_obj.global_deletion_ids
 
 
 @pytest.mark.parametrize(
@@ -486,38 +219,28 @@ def test_collect_deleted_ids_for_meetings_negative(
                     "created_at": "",
                 }
             ],
-            {"code": 1001, "message": "Role does not exist: 844424930334011."},
+            dump_json({"code": 1001, "message": "Role does not exist: 844424930334011."}),
         )
     ],
 )
 def test_collect_past_deleted_meetings_positive(
-    requests_mock,
+    zoom_api_responses,
+    deletion_sync_obj,
     past_meeting_id_list,
     delete_key_list,
     deletion_response,
 ):
     """Test that deletion_sync_command deletes past_meetings object from Enterprise Search.
-    :param requests_mock: fixture for requests.get calls.
+    :param zoom_api_responses: dictionary of the mocked Zoom API responses per object type.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
     :param past_meeting_id_list: list of past_meeting_id deleted from zoom.
     :param delete_key_list: list of dictionary of delete_keys exist in doc_id storage.
-    :param deletion_response: dictionary of mocked api response.
+    :param deletion_response: encoded json of the mocked api response.
     """
     # Setup
-    _, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/past_meetings/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=404,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
+    past_meeting_id_list = list(past_meeting_id_list)
+    delete_key_list = copy.deepcopy(delete_key_list)
+    zoom_api_responses["past_meetings"] = (404, deletion_response)
 
     # Execute
     deletion_sync_obj.collect_past_deleted_meetings(
@@ -541,41 +264,28 @@ def test_collect_past_deleted_meetings_positive(
                     "created_at": "",
                 }
             ],
-            {
-                "id": "844424930334011",
-                "type": "past_meetings",
-            },
+            dump_json({"id": "844424930334011", "type": "past_meetings"}),
         )
     ],
 )
 def test_collect_past_deleted_meetings_negative(
-    requests_mock,
+    zoom_api_responses,
+    deletion_sync_obj,
     past_meeting_id_list,
     delete_key_list,
     deletion_response,
 ):
     """Test that deletion_sync_command won't delete past_meetings object from Enterprise Search if it exist in Zoom.
-    :param requests_mock: fixture for requests.get calls.
+    :param zoom_api_responses: dictionary of the mocked Zoom API responses per object type.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
     :param past_meeting_id_list: list of past_meeting_id deleted from zoom.
     :param delete_key_list: list of dictionary of delete_keys exist in doc_id storage.
-    :param deletion_response: dictionary of mocked api response.
+    :param deletion_response: encoded json of the mocked api response.
     """
     # Setup
-    _, _ = settings(requests_mock)
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    deletion_sync_obj = DeletionSyncCommand(args)
-    headers = {
-        "authorization": "Bearer dummy_access_token",
-        "content-type": "application/json",
-    }
-    requests_mock.get(
-        "https://api.zoom.us/v2/past_meetings/844424930334011",
-        headers=headers,
-        json=deletion_response,
-        status_code=200,
-    )
-    deletion_sync_obj.zoom_client.ensure_token_valid()
+    past_meeting_id_list = list(past_meeting_id_list)
+    delete_key_list = copy.deepcopy(delete_key_list)
+    zoom_api_responses["past_meetings"] = (200, deletion_response)
 
     # Execute
     deletion_sync_obj.collect_past_deleted_meetings(
@@ -612,32 +322,32 @@ def test_collect_past_deleted_meetings_negative(
 @patch.object(SyncZoom, "perform_sync")
 def test_collect_channels_and_recordings_ids_positive(
     mock1,
-    requests_mock,
+    monkeypatch,
+    deletion_sync_obj,
     objects_ids_list,
     response_list,
     deletion_response,
 ):
     """Test that deletion_sync_command deletes channels, recordings, chats and files object from Enterprise Search.
     :param mock1: patch object for perform_sync method.
-    :param requests_mock: fixture for requests.get calls.
+    :param monkeypatch: fixture for patching the Zoom users fetching and the jobs execution for the test only.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
     :param objects_ids_list: list of objects ids deleted from zoom.
     :param response_list: list of dictionary of mocked api response.
     :param deletion_response: list of deleted documents ids.
     """
     # Setup
-    _, _ = settings(requests_mock)
-    args = get_args("DeletionSyncCommand")
-    deletion = DeletionSyncCommand(args)
+    objects_ids_list = list(objects_ids_list)
+    response_list = copy.deepcopy(response_list)
     mock1.return_value = [response_list]
-    deletion.create_and_execute_jobs = Mock(return_value=response_list)
-    SyncZoom.get_all_users_from_zoom = Mock()
-    deletion.zoom_client.ensure_token_valid()
+    monkeypatch.setattr(deletion_sync_obj, "create_and_execute_jobs", lambda *args, **kwargs: response_list)
+    monkeypatch.setattr(SyncZoom, "get_all_users_from_zoom", lambda *args, **kwargs: None)
 
     # Execute
-    deletion.collect_channels_and_recordings_ids(objects_ids_list)
+    deletion_sync_obj.collect_channels_and_recordings_ids(objects_ids_list)
 
     # Assert
-    assert deletion.global_deletion_ids == deletion_response
+    assert deletion_sync_obj.global_deletion_ids == deletion_response
 
 
 @pytest.mark.parametrize(
@@ -665,31 +375,31 @@ def test_collect_channels_and_recordings_ids_positive(
 @patch.object(SyncZoom, "perform_sync")
 def test_collect_channels_and_recordings_ids_negative(
     mock1,
-    requests_mock,
+    monkeypatch,
+    deletion_sync_obj,
     objects_ids_list,
     response_list,
 ):
     """Test that deletion_sync_command won't delete channels, recordings, chats and files object from Enterprise Search
     if it exist in Zoom.
     :param mock1: patch object for perform_sync method.
-    :param requests_mock: fixture for requests.get calls.
+    :param monkeypatch: fixture for patching the Zoom users fetching and the jobs execution for the test only.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
     :param objects_ids_list: list of objects ids deleted from zoom.
     :param response_list: list of dictionary of mocked api response.
     """
     # Setup
-    _, _ = settings(requests_mock)
-    args = get_args("DeletionSyncCommand")
-    deletion = DeletionSyncCommand(args)
+    objects_ids_list = list(objects_ids_list)
+    response_list = copy.deepcopy(response_list)
     mock1.return_value = [response_list]
-    deletion.create_and_execute_jobs = Mock(return_value=response_list)
-    SyncZoom.get_all_users_from_zoom = Mock()
-    deletion.zoom_client.ensure_token_valid()
+    monkeypatch.setattr(deletion_sync_obj, "create_and_execute_jobs", lambda *args, **kwargs: response_list)
+    monkeypatch.setattr(SyncZoom, "get_all_users_from_zoom", lambda *args, **kwargs: None)
 
     # Execute
-    deletion.collect_channels_and_recordings_ids(objects_ids_list)
+    deletion_sync_obj.collect_channels_and_recordings_ids(objects_ids_list)
 
     # Assert
-    assert [] == deletion.global_deletion_ids
+    assert [] == deletion_sync_obj.global_deletion_ids
 
 
 @pytest.mark.parametrize(
@@ -718,32 +428,32 @@ def test_collect_channels_and_recordings_ids_negative(
 @patch.object(SyncZoom, "perform_sync")
 def test_collect_chats_and_files_ids_positive(
     mock1,
-    requests_mock,
+    monkeypatch,
+    deletion_sync_obj,
     objects_ids_list,
     response_list,
     deletion_response,
 ):
     """Test that deletion_sync_command deletes chats and files object from Enterprise Search.
     :param mock1: patch object for perform_sync method.
-    :param requests_mock: fixture for requests.get calls.
+    :param monkeypatch: fixture for patching the Zoom users fetching and the jobs execution for the test only.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
     :param objects_ids_list: list of objects ids deleted from zoom.
     :param response_list: list of dictionary of mocked api response.
     :param deletion_response: list of deleted documents ids.
     """
     # Setup
-    _, _ = settings(requests_mock)
-    args = get_args("DeletionSyncCommand")
-    deletion = DeletionSyncCommand(args)
+    objects_ids_list = list(objects_ids_list)
+    response_list = copy.deepcopy(response_list)
     mock1.return_value = [response_list]
-    deletion.create_and_execute_jobs = Mock(return_value=response_list)
-    SyncZoom.get_all_users_from_zoom = Mock()
-    deletion.zoom_client.ensure_token_valid()
+    monkeypatch.setattr(deletion_sync_obj, "create_and_execute_jobs", lambda *args, **kwargs: response_list)
+    monkeypatch.setattr(SyncZoom, "get_all_users_from_zoom", lambda *args, **kwargs: None)
 
     # Execute
-    deletion.collect_channels_and_recordings_ids(objects_ids_list)
+    deletion_sync_obj.collect_channels_and_recordings_ids(objects_ids_list)
 
     # Assert
-    assert deletion.global_deletion_ids == deletion_response
+    assert deletion_sync_obj.global_deletion_ids == deletion_response
 
 
 @pytest.mark.parametrize(
@@ -771,28 +481,28 @@ def test_collect_chats_and_files_ids_positive(
 @patch.object(SyncZoom, "perform_sync")
 def test_collect_chats_and_files_ids_negative(
     mock1,
-    requests_mock,
+    monkeypatch,
+    deletion_sync_obj,
     objects_ids_list,
     response_list,
 ):
     """Test that deletion_sync_command won't delete chats and files object from Enterprise Search
     if it exist in Zoom.
     :param mock1: patch object for perform_sync method.
-    :param requests_mock: fixture for requests.get calls.
+    :param monkeypatch: fixture for patching the Zoom users fetching and the jobs execution for the test only.
+    :param deletion_sync_obj: DeletionSyncCommand instance shared by the module.
     :param objects_ids_list: list of objects ids deleted from zoom.
     :param response_list: list of dictionary of mocked api response.
     """
     # Setup
-    _, _ = settings(requests_mock)
-    args = get_args("DeletionSyncCommand")
-    deletion = DeletionSyncCommand(args)
+    objects_ids_list = list(objects_ids_list)
+    response_list = copy.deepcopy(response_list)
     mock1.return_value = [response_list]
-    deletion.create_and_execute_jobs = Mock(return_value=response_list)
-    SyncZoom.get_all_users_from_zoom = Mock()
-    deletion.zoom_client.ensure_token_valid()
+    monkeypatch.setattr(deletion_sync_obj, "create_and_execute_jobs", lambda *args, **kwargs: response_list)
+    monkeypatch.setattr(SyncZoom, "get_all_users_from_zoom", lambda *args, **kwargs: None)
 
     # Execute
-    deletion.collect_channels_and_recordings_ids(objects_ids_list)
+    deletion_sync_obj.collect_channels_and_recordings_ids(objects_ids_list)
 
     # Assert
-    assert [] == deletion.global_deletion_ids
+    assert [] == deletion_sync_obj.global_deletion_ids
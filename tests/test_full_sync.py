@@ -4,32 +4,23 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 
-import logging
-import os
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch, sentinel
 
-from ees_zoom.configuration import Configuration
-from ees_zoom.connector_queue import ConnectorQueue
 from ees_zoom.full_sync_command import FullSyncCommand
 from ees_zoom.sync_zoom import SyncZoom
-from support import get_args
+from support import InMemoryConnectorQueue, get_args, load_configuration, get_test_logger
+
+logger = get_test_logger("unit_test_full_sync")
 
 
 def settings():
     """This function loads configuration from the file and returns it along with retry_count setting."""
-
-    configuration = Configuration(
-        file_name=os.path.join(
-            os.path.join(os.path.dirname(__file__), "config"),
-            "zoom_connector.yml",
-        )
-    )
-    logger = logging.getLogger("unit_test_full_sync")
+    configuration = load_configuration()
     return configuration, logger
 
 
-@patch.object(SyncZoom, "perform_sync")
-@patch.object(SyncZoom, "get_all_users_from_zoom")
+@patch.object(SyncZoom, "perform_sync", autospec=True)
+@patch.object(SyncZoom, "get_all_users_from_zoom", autospec=True)
 def test_start_producer(mock1, mock2):
     """Test method of start producer to fetching data from outlook for full sync
     :param mock1: patch for get_all_users_from_zoom
@@ -38,12 +29,11 @@ def test_start_producer(mock1, mock2):
     config, logger = settings()
     args = get_args("FullSyncCommand")
     full = FullSyncCommand(args)
-    queue = ConnectorQueue(logger)
-    mock1.return_value = [MagicMock()]
-    full.create_and_execute_jobs = Mock()
-    full.create_and_execute_jobs.return_value = MagicMock()
+    queue = InMemoryConnectorQueue(logger)
+    mock1.return_value = [sentinel.partitioned_users_list]
+    full.create_and_execute_jobs = Mock(return_value=[])
     full.zoom_client.ensure_token_valid = Mock()
-    mock2.return_value = MagicMock()
+    mock2.return_value = []
     full.start_producer(queue)
     time_independent_objects = ["roles", "groups", "channels"]
     object_types_count = 0
@@ -54,5 +44,3 @@ def test_start_producer(mock1, mock2):
         "enterprise_search_sync_thread_count"
     )
     assert queue.qsize() == total_expected_size
-    queue.close()
-    queue.join_thread()
@@ -4,91 +4,101 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 import argparse
-import logging
-import os
-import sys
-from unittest.mock import MagicMock, Mock
+from importlib.util import find_spec
+from unittest.mock import Mock
 
 import pytest
 from elastic_enterprise_search import __version__
 from packaging import version
 
-if version.parse(__version__) >= version.parse("8.0"):
+IS_ENTERPRISE_SEARCH_V8 = version.parse(__version__) >= version.parse("8.0")
+if IS_ENTERPRISE_SEARCH_V8:
     from elastic_enterprise_search.exceptions import BadGatewayError
 else:
     from elastic_transport.exceptions import BadGatewayError
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-
-from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.connector_queue import ConnectorQueue  # noqa
+from ees_zoom import utils  # noqa
 from ees_zoom.enterprise_search_wrapper import EnterpriseSearchWrapper  # noqa
 from ees_zoom.sync_enterprise_search import SyncEnterpriseSearch  # noqa
-
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
+from support import InMemoryConnectorQueue, get_test_logger  # noqa
+
+logger = get_test_logger("unit_test_indexing")
+BENCHMARK_DOCUMENTS_COUNT = 1000
+
+DUMMY_DOCUMENTS = (
+    {
+        "id": 0,
+        "title": "file0",
+        "body": "Not much. It is a made up thing.",
+        "url": "dummy_folder/file0.txt",
+        "created_at": "2019-06-01T12:00:00+00:00",
+        "type": "text",
+    },
+    {
+        "id": 1,
+        "title": "file1",
+        "body": "Not much. It is a made up thing.",
+        "url": "dummy_folder/file1.txt",
+        "created_at": "2019-06-01T12:00:00+00:00",
+        "type": "text",
+    },
 )
+INDEXED_RESPONSE = {"results": [{"id": "0", "errors": []}, {"id": "1", "errors": []}]}
+NOT_INDEXED_RESPONSE = {"results": [{"id": "0", "errors": ["not indexed"]}]}
 
 
-def settings():
-    """This function loads configuration from the file and initialize logger.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
+@pytest.fixture(autouse=True)
+def skip_retry_sleeps(monkeypatch):
+    """Skips the waits between the retries of the Enterprise Search calls, the retries themselves still run.
+    :param monkeypatch: fixture for patching the sleep of the retry decorator.
     """
-    configuration = Configuration(file_name=CONFIG_FILE)
-
-    logger = logging.getLogger("unit_test_indexing")
-    return configuration, logger
+    monkeypatch.setattr(utils.time, "sleep", lambda seconds: None)
 
 
-def create_enterprise_search_object():
-    """This function create Enterprise Search object for test."""
-    configs, logger = settings()
+@pytest.fixture(scope="module")
+def workplace_search_client(base_configuration):
+    """This fixture creates the Enterprise Search client once for the module, tests patch its methods
+    with monkeypatch so that the patches are undone after each test.
+    :param base_configuration: Configuration instance shared by the test session.
+    :returns workplace_search_client: EnterpriseSearchWrapper instance
+    """
     args = argparse.Namespace()
-    workplace_search_client = EnterpriseSearchWrapper(logger, configs, args)
-    queue = ConnectorQueue(logger)
+    return EnterpriseSearchWrapper(logger, base_configuration, args)
+
+
+@pytest.fixture
+def indexer_object(base_configuration, workplace_search_client):
+    """This fixture creates a SyncEnterpriseSearch with fresh counters around the shared Enterprise Search client.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param workplace_search_client: EnterpriseSearchWrapper instance shared by the module.
+    :returns indexer_object: SyncEnterpriseSearch instance
+    """
+    queue = InMemoryConnectorQueue(logger)
     queue.end_signal()
-    return SyncEnterpriseSearch(configs, logger, workplace_search_client, queue)
+    return SyncEnterpriseSearch(base_configuration, logger, workplace_search_client, queue)
 
 
 @pytest.mark.parametrize(
     "documents, mock_response",
     [
         (
-            [
-                {
-                    "id": 0,
-                    "title": "file0",
-                    "body": "Not much. It is a made up thing.",
-                    "url": "dummy_folder/file0.txt",
-                    "created_at": "2019-06-01T12:00:00+00:00",
-                    "type": "text",
-                },
-                {
-                    "id": 1,
-                    "title": "file1",
-                    "body": "Not much. It is a made up thing.",
-                    "url": "dummy_folder/file1.txt",
-                    "created_at": "2019-06-01T12:00:00+00:00",
-                    "type": "text",
-                },
-            ],
-            {"results": [{"id": "0", "errors": []}, {"id": "1", "errors": []}]},
+            list(DUMMY_DOCUMENTS),
+            INDEXED_RESPONSE,
         )
     ],
 )
-def test_index_document(documents, mock_response, caplog):
+def test_index_document(indexer_object, monkeypatch, documents, mock_response, caplog):
     """Test that index_document successfully index documents in Enterprise Search.
+    :param indexer_object: SyncEnterpriseSearch instance around the shared Enterprise Search client.
+    :param monkeypatch: fixture for patching the shared Enterprise Search client.
     :param documents: generated document.
     :param mock_response: mocked returned response
     :param caplog: records the attributes from current stage.
     """
     # Setup
     caplog.set_level("INFO")
-    indexer_object = create_enterprise_search_object()
-    indexer_object.workplace_search_client.index_documents = Mock(
-        return_value=mock_response
+    monkeypatch.setattr(
+        indexer_object.workplace_search_client, "index_documents", Mock(return_value=mock_response)
     )
 
     # Execute
@@ -97,35 +107,24 @@ def test_index_document(documents, mock_response, caplog):
     # Assert
     assert indexer_object.total_document_indexed == 2
 
-    # Cleanup
-    indexer_object.queue.close()
-    indexer_object.queue.join_thread()
-
 
 @pytest.mark.parametrize(
     "documents, mock_response, log_level, error_msg",
     [
         (
-            [
-                {
-                    "id": 0,
-                    "title": "file0",
-                    "body": "Not much. It is a made up thing.",
-                    "url": "dummy_folder/file0.txt",
-                    "created_at": "2019-06-01T12:00:00+00:00",
-                    "type": "text",
-                }
-            ],
-            {"results": [{"id": "0", "errors": ["not indexed"]}]},
+            [DUMMY_DOCUMENTS[0]],
+            NOT_INDEXED_RESPONSE,
             "ERROR",
             "Unable to index the document with id: 0",
         )
     ],
 )
 def test_index_document_when_error_occurs(
-    documents, mock_response, log_level, error_msg, caplog
+    indexer_object, monkeypatch, documents, mock_response, log_level, error_msg, caplog
 ):
     """Test that index_document give proper error message if document not indexed.
+    :param indexer_object: SyncEnterpriseSearch instance around the shared Enterprise Search client.
+    :param monkeypatch: fixture for patching the shared Enterprise Search client.
     :param documents: Generated document ready to be indexed.
     :param mock_response: Mocker response object
     :param log_msg: Log message to display.
@@ -133,28 +132,25 @@ def test_index_document_when_error_occurs(
     """
     # Setup
     caplog.set_level(log_level)
-    indexer_object = create_enterprise_search_object()
-    indexer_object.workplace_search_client.index_documents = Mock(
-        return_value=mock_response
+    monkeypatch.setattr(
+        indexer_object.workplace_search_client, "index_documents", Mock(return_value=mock_response)
     )
 
     # Execute
     indexer_object.index_documents(documents)
 
     # Assert
-    assert error_msg in caplog.text
-
-    # Cleanup
-    indexer_object.queue.close()
-    indexer_object.queue.join_thread()
+    assert any(error_msg in record.getMessage() for record in caplog.records)
 
 
-def test_perform_sync_enterprise_search():
+def test_perform_sync_enterprise_search(indexer_object, monkeypatch):
     """Test that perform_sync of sync_enterprise_search pull documents from the queue and index it to the \
-         Enterprise Search."""
+         Enterprise Search.
+    :param indexer_object: SyncEnterpriseSearch instance around the shared Enterprise Search client.
+    :param monkeypatch: fixture for patching the shared Enterprise Search client.
+    """
     # Setup
-    indexer_object = create_enterprise_search_object()
-    indexer_object.index_documents = Mock(return_value=True)
+    monkeypatch.setattr(indexer_object, "index_documents", Mock(return_value=True))
 
     # Execute
     indexer_object.perform_sync()
@@ -162,113 +158,97 @@ def test_perform_sync_enterprise_search():
     # Assert
     assert indexer_object.queue.empty()
 
-    # Cleanup
-    indexer_object.queue.close()
-    indexer_object.queue.join_thread()
 
+class IndexDocumentsStub:
+    """Stub of the index_documents method of the Workplace Search client, it counts the calls and returns or
+    raises the given responses in order."""
 
-def test_index_document_negative():
-    """Test that index_document retries for BadGateway and Timeout exception."""
-    # Setup
-    dummy_documents_to_index = [
-        {
-            "id": 0,
-            "title": "file0",
-            "body": "Not much. It is a made up thing.",
-            "url": "dummy_folder/file0.txt",
-            "created_at": "2019-06-01T12:00:00+00:00",
-            "type": "text",
-        },
-        {
-            "id": 1,
-            "title": "file1",
-            "body": "Not much. It is a made up thing.",
-            "url": "dummy_folder/file1.txt",
-            "created_at": "2019-06-01T12:00:00+00:00",
-            "type": "text",
-        },
-    ]
-    indexer_object = create_enterprise_search_object()
-    mock_response = [Mock(), Mock(), Mock()]
-    if version.parse(__version__) >= version.parse("8.0"):
-        mock_response[0] = BadGatewayError(
-            meta=Mock(status=502),
-            message="Connection Reset By peer",
-            body="Connection reset reason",
-        )
-        mock_response[1] = BadGatewayError(
+    def __init__(self, responses):
+        self.responses = iter(responses)
+        self.call_count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        response = next(self.responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def create_bad_gateway_error():
+    """This function creates the BadGatewayError raised by the installed Enterprise Search client version."""
+    if IS_ENTERPRISE_SEARCH_V8:
+        return BadGatewayError(
             meta=Mock(status=502),
             message="Connection Reset By peer",
             body="Connection reset reason",
         )
-    else:
-        mock_response[0] = BadGatewayError(message="Connection Reset By peer")
-        mock_response[1] = BadGatewayError(message="Connection Reset By peer")
-    mock_response[2] = {
-        "results": [{"id": "0", "errors": []}, {"id": "1", "errors": []}]
-    }
-    indexer_object.workplace_search_client.workplace_search_client.index_documents = (
-        MagicMock()
-    )
-    indexer_object.workplace_search_client.workplace_search_client.index_documents.side_effect = (
-        mock_response
+    return BadGatewayError(message="Connection Reset By peer")
+
+
+@pytest.mark.parametrize(
+    "failed_calls_count, expected_call_count",
+    [
+        pytest.param(2, 3, id="negative"),
+        pytest.param(0, 1, id="positive"),
+    ],
+)
+def test_index_document_with_retries(indexer_object, monkeypatch, failed_calls_count, expected_call_count):
+    """Test that index_document successfully index documents in Enterprise Search, retrying for BadGateway
+    and Timeout exception.
+    :param indexer_object: SyncEnterpriseSearch instance around the shared Enterprise Search client.
+    :param monkeypatch: fixture for patching the shared Enterprise Search client.
+    :param failed_calls_count: number of calls failing with a BadGatewayError before the documents are indexed.
+    :param expected_call_count: expected number of index calls made to Enterprise Search.
+    """
+    # Setup
+    mock_response = [create_bad_gateway_error() for _ in range(failed_calls_count)]
+    mock_response.append(INDEXED_RESPONSE)
+    index_documents_stub = IndexDocumentsStub(mock_response)
+    monkeypatch.setattr(
+        indexer_object.workplace_search_client.workplace_search_client,
+        "index_documents",
+        index_documents_stub,
     )
     timeout = 60
 
     # Execute
     indexer_object.workplace_search_client.index_documents(
-        dummy_documents_to_index, timeout
+        list(DUMMY_DOCUMENTS), timeout
     )
 
     # Assert
-    assert (
-        3
-        == indexer_object.workplace_search_client.workplace_search_client.index_documents.call_count
-    )
+    assert expected_call_count == index_documents_stub.call_count
 
 
-def test_index_document_positive():
-    """Test that index_document successfully index documents in Enterprise Search."""
+@pytest.mark.skipif(find_spec("pytest_codspeed") is None, reason="pytest-codspeed is not installed")
+def test_perform_sync_benchmark(benchmark, indexer_object, monkeypatch):
+    """Benchmarks perform_sync of sync_enterprise_search pulling a thousand documents from the queue and
+    indexing them to the Enterprise Search, so that indexing rate regressions are caught.
+    :param benchmark: pytest-codspeed fixture measuring the wrapped call.
+    :param indexer_object: SyncEnterpriseSearch instance around the shared Enterprise Search client.
+    :param monkeypatch: fixture for patching the shared Enterprise Search client.
+    """
     # Setup
-    dummy_documents_to_index = [
-        {
-            "id": 0,
-            "title": "file0",
-            "body": "Not much. It is a made up thing.",
-            "url": "dummy_folder/file0.txt",
-            "created_at": "2019-06-01T12:00:00+00:00",
-            "type": "text",
-        },
-        {
-            "id": 1,
-            "title": "file1",
-            "body": "Not much. It is a made up thing.",
-            "url": "dummy_folder/file1.txt",
-            "created_at": "2019-06-01T12:00:00+00:00",
-            "type": "text",
-        },
+    documents = [
+        {**DUMMY_DOCUMENTS[0], "id": document_id, "title": f"file{document_id}"}
+        for document_id in range(BENCHMARK_DOCUMENTS_COUNT)
     ]
-    indexer_object = create_enterprise_search_object()
-    mock_response = [Mock()]
-    mock_response[0] = {
-        "results": [{"id": "0", "errors": []}, {"id": "1", "errors": []}]
-    }
-    indexer_object.workplace_search_client.workplace_search_client.index_documents = (
-        MagicMock()
+    monkeypatch.setattr(
+        indexer_object.workplace_search_client,
+        "index_documents",
+        lambda documents, timeout: {"results": [{"id": document["id"], "errors": []} for document in documents]},
     )
-    indexer_object.workplace_search_client.workplace_search_client.index_documents.side_effect = (
-        mock_response
-    )
-    timeout = 60
+
+    def perform_sync():
+        """Fills a new queue with the documents and the end signal, then drains it with perform_sync."""
+        indexer_object.queue = InMemoryConnectorQueue(logger)
+        indexer_object.queue.append_to_queue(documents)
+        indexer_object.queue.end_signal()
+        return indexer_object.perform_sync()
 
     # Execute
-    indexer_object.workplace_search_client.index_documents(
-        dummy_documents_to_index, timeout
-    )
+    _, indexed_documents_ids = benchmark(perform_sync)
 
     # Assert
-    assert 1 == indexer_object.workplace_search_client.workplace_search_client.index_documents.call_count
-
-    # Cleanup
-    indexer_object.queue.close()
-    indexer_object.queue.join_thread()
+    assert len(indexed_documents_ids) == BENCHMARK_DOCUMENTS_COUNT
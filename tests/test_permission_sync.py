@@ -4,62 +4,52 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 import argparse
-import logging
-import os
-import sys
 import unittest.mock
 from unittest.mock import MagicMock, Mock, patch
 
-from support import get_args
+import pytest
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom.permission_sync_command import PermissionSyncCommand
+from ees_zoom.zoom_roles import ZoomRoles
+from support import CONFIG_FILE, get_test_logger
 
+logger = get_test_logger("unit_test_permission_sync")
 
-from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.permission_sync_command import PermissionSyncCommand  # noqa
-from ees_zoom.zoom_roles import ZoomRoles # noqa
 
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
-
-
-def settings():
-    """This function loads configuration from the file and initialize logger.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
+@pytest.fixture(scope="module")
+def permission_object():
+    """This fixture creates a PermissionSyncCommand once for the module, tests patch its clients with
+    monkeypatch so that the patches are undone after each test.
+    :returns permission_object: PermissionSyncCommand instance
     """
-    configuration = Configuration(file_name=CONFIG_FILE)
-
-    logger = logging.getLogger("unit_test_permission_sync")
-    return configuration, logger
+    args = argparse.Namespace(config_file=CONFIG_FILE)
+    return PermissionSyncCommand(args)
 
 
-def test_remove_all_permissions():
-    """Test that remove_all_permissions remove all permissions from Enterprise Search."""
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    permission_object = PermissionSyncCommand(args)
+def test_remove_all_permissions(permission_object, monkeypatch):
+    """Test that remove_all_permissions remove all permissions from Enterprise Search.
+    :param permission_object: PermissionSyncCommand instance shared by the module.
+    :param monkeypatch: fixture for patching the Enterprise Search client.
+    """
     mocked_respose = {"results": [{"user": "user1", "permissions": "permission1"}]}
-    permission_object.workplace_search_client.list_permissions = Mock(
-        return_value=mocked_respose
+    monkeypatch.setattr(
+        permission_object.workplace_search_client, "list_permissions", Mock(return_value=mocked_respose)
     )
-    permission_object.workplace_search_client.remove_user_permissions = Mock(
-        return_value=True
+    monkeypatch.setattr(
+        permission_object.workplace_search_client, "remove_user_permissions", Mock(return_value=True), raising=False
     )
     mock = Mock()
     mock.permission_object.remove_all_permissions()
     mock.permission_object.remove_all_permissions.assert_called()
 
 
-def test_workplace_add_permission():
-    """Test that workplace_add_permission successfully add permission to Enterprise Search."""
-    args = argparse.Namespace()
-    args.config_file = CONFIG_FILE
-    permission_object = PermissionSyncCommand(args)
-    permission_object.workplace_search_client.add_user_permissions = Mock(
-        return_value=True
+def test_workplace_add_permission(permission_object, monkeypatch):
+    """Test that workplace_add_permission successfully add permission to Enterprise Search.
+    :param permission_object: PermissionSyncCommand instance shared by the module.
+    :param monkeypatch: fixture for patching the Enterprise Search client.
+    """
+    monkeypatch.setattr(
+        permission_object.workplace_search_client, "add_user_permissions", Mock(return_value=True), raising=False
     )
     mock = Mock()
     mock.permission_object.workplace_add_permission("user1", "permission1")
@@ -70,20 +60,21 @@ def test_workplace_add_permission():
 @patch.object(ZoomRoles, "fetch_role_permissions")
 @patch.object(ZoomRoles, "fetch_members_of_role")
 def test_set_permissions_list(
-    mock_members_of_role, mock_role_permission, mock_list_of_role
+    mock_members_of_role, mock_role_permission, mock_list_of_role, base_configuration, permission_object, monkeypatch
 ):
     """Tests the set_permission_list function for permission sync.
     :param mock_members_of_role: patch object for fetch_members_of_role
     :param mock_role_permission: patch object for fetch_role_permissions
     :param mock_list_of_role: patch object for set_list_of_roles_from_zoom
+    :param base_configuration: Configuration instance shared by the test session.
+    :param permission_object: PermissionSyncCommand instance shared by the module.
+    :param monkeypatch: fixture for patching the Zoom and Enterprise Search clients.
     """
     # Setup
-    config, logger = settings()
-    args = get_args("PermissionSyncCommand")
-    permission_sync = PermissionSyncCommand(args)
-    permission_sync.zoom_client.ensure_token_valid = Mock()
+    permission_sync = permission_object
+    monkeypatch.setattr(permission_sync.zoom_client, "ensure_token_valid", Mock())
     roles_object = ZoomRoles(
-        config,
+        base_configuration,
         logger,
         permission_sync.zoom_client,
         permission_sync.zoom_enterprise_search_mappings,
@@ -95,8 +86,8 @@ def test_set_permissions_list(
         dummy_user_ids = ["zoom_user_id", "zoom_user_id_2"]
         mock_role_permission.return_value = dummy_permissions
         mock_members_of_role.return_value = dummy_user_ids
-        permission_sync.workplace_search_client.add_user_permissions = Mock(
-            return_value=True
+        monkeypatch.setattr(
+            permission_sync.workplace_search_client, "add_user_permissions", Mock(return_value=True), raising=False
         )
 
         # Execute
@@ -104,8 +95,8 @@ def test_set_permissions_list(
             permission_sync.zoom_enterprise_search_mappings
         )
 
-        permission_sync.workplace_search_client.add_user_permissions = Mock(
-            return_value=True
+        monkeypatch.setattr(
+            permission_sync.workplace_search_client, "add_user_permissions", Mock(return_value=True), raising=False
         )
         mock = Mock()
         mock.permission_sync.workplace_add_permission(
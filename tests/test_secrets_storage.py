@@ -4,92 +4,135 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 
-import json
-import logging
 import os
-import sys
 import time
+from functools import lru_cache
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.secrets_storage import SecretsStorage  # noqa
+import pytest
 
-SECRETS_JSON_PATH = os.path.join(
-    os.path.abspath(os.path.join(os.path.dirname(__file__), "..")),
-    "ees_zoom",
-    "secrets.json",
-)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
+from ees_zoom import secrets_storage as secrets_storage_module
+from ees_zoom.secrets_storage import SecretsStorage
+from support import dump_json, get_test_logger
 
 REFRESH_TOKEN_FIELD = "zoom.refresh_token"
 ACCESS_TOKEN_FIELD = "zoom.access_token"
 EXPIRATION_TIME_FIELD = "zoom.access_token_expiry_time"
+SECRETS = {
+    REFRESH_TOKEN_FIELD: "xyzabcaaaabbbb",
+    ACCESS_TOKEN_FIELD: "abcdfhghhshgg",
+}
 
+logger = get_test_logger("unit_test_secrets_storage")
 
-def settings():
-    """This function loads configuration from the file and initialize logger.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
+
+@lru_cache(maxsize=4)
+def _parse_secrets_file(path, modification_time):
+    """Parses the secrets storage file, the parsed content is cached per file and modification time.
+    :param path: path of the secrets storage file
+    :param modification_time: modification time of the secrets storage file in nanoseconds
+    :returns secrets: dictionary of the stored secrets
+    """
+    with open(path, "rb") as secrets_store:
+        return json_loads(secrets_store.read())
+
+
+def read_secrets(path):
+    """Returns the content of the secrets storage file, the file is parsed again only when it was modified.
+    :param path: path of the secrets storage file
+    :returns secrets: dictionary of the stored secrets
+    """
+    return _parse_secrets_file(str(path), os.stat(path).st_mtime_ns)
+
+
+@pytest.fixture(autouse=True)
+def clear_secrets_cache():
+    """This fixture drops the parsed secrets storage files once the test is done, as set_secrets may
+    rewrite a file within the granularity of its modification time.
+    """
+    yield
+    _parse_secrets_file.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def access_token_expiry_time():
+    """This fixture computes the expiration time of the access tokens stored by the tests of the module.
+    :returns access_token_expiry_time: expiration time of a valid access token.
     """
-    configuration = Configuration(file_name=CONFIG_FILE)
+    return time.time() + 3500
+
 
-    logger = logging.getLogger("unit_test_secrets_storage")
-    return configuration, logger
+@pytest.fixture
+def secrets_file(tmp_path, monkeypatch):
+    """This fixture points the secrets storage to a file in the temporary directory of the test, so that
+    every test starts without a secrets storage, independently of the other tests.
+    :param tmp_path: fixture for the temporary directory of the test.
+    :param monkeypatch: fixture for patching the path of the secrets storage.
+    :returns secrets_file: path of the secrets storage file
+    """
+    secrets_file = tmp_path / "secrets.json"
+    monkeypatch.setattr(secrets_storage_module, "SECRETS_JSON_PATH", str(secrets_file))
+    return secrets_file
 
 
-def test_get_secrets_when_json_file_absent():
-    """test the fetching mechanism of secret storage data when secrets storage is unavailable."""
-    config, logger = settings()
-    if os.path.exists(SECRETS_JSON_PATH):
-        os.remove(SECRETS_JSON_PATH)
-    secrets_storage = SecretsStorage(config, logger)
+def test_get_secrets_when_json_file_absent(secrets_file, base_configuration):
+    """test the fetching mechanism of secret storage data when secrets storage is unavailable.
+    :param secrets_file: path of the absent secrets storage file.
+    :param base_configuration: Configuration instance shared by the test session.
+    """
+    secrets_storage = SecretsStorage(base_configuration, logger)
     secrets_storage = secrets_storage.get_secrets()
     assert secrets_storage is None
 
 
-def test_set_secrets_with_json_absent():
-    """test the storing mechanism of secret storage data when secrets storage is not available."""
-    if os.path.exists(SECRETS_JSON_PATH):
-        os.remove(SECRETS_JSON_PATH)
-    config, logger = settings()
-    secrets_storage = SecretsStorage(config, logger)
-    access_token_expiry_time = time.time() + 3500
-    secrets = {
-        REFRESH_TOKEN_FIELD: "xyzabcaaaabbbb",
-        ACCESS_TOKEN_FIELD: "abcdfhghhshgg",
-        EXPIRATION_TIME_FIELD: access_token_expiry_time,
-    }
+def test_set_secrets_with_json_absent(secrets_file, base_configuration, access_token_expiry_time):
+    """test the storing mechanism of secret storage data when secrets storage is not available.
+    :param secrets_file: path of the absent secrets storage file.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param access_token_expiry_time: expiration time of a valid access token.
+    """
+    secrets_storage = SecretsStorage(base_configuration, logger)
+    secrets = {**SECRETS, EXPIRATION_TIME_FIELD: access_token_expiry_time}
     secrets_storage.set_secrets(secrets)
-    with open(SECRETS_JSON_PATH, encoding="UTF-8") as secrets_store:
-        secrets_data = json.load(secrets_store)
-    assert secrets_data["zoom.refresh_token"] == "xyzabcaaaabbbb" and secrets_data["zoom.access_token"] == "abcdfhghhshgg", secrets_data["zoom.access_token_expiry_time"] == access_token_expiry_time
-
-
-def test_set_secrets_with_json_present():
-    """test the storing mechanism of secret storage data when secrets storage is available."""
-    config, logger = settings()
-    secrets_storage = SecretsStorage(config, logger)
-    access_token_expiry_time = time.time() + 3500
-    secrets = {
-        REFRESH_TOKEN_FIELD: "xyzabcaaaabbbb",
-        ACCESS_TOKEN_FIELD: "abcdfhghhshgg",
-        EXPIRATION_TIME_FIELD: access_token_expiry_time,
-    }
+    assert read_secrets(secrets_file) == secrets
+
+
+def test_set_secrets_with_json_present(secrets_file, base_configuration, access_token_expiry_time):
+    """test the storing mechanism of secret storage data when secrets storage is available.
+    :param secrets_file: path of the secrets storage file, holding outdated secrets.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param access_token_expiry_time: expiration time of a valid access token.
+    """
+    secrets_file.write_bytes(
+        dump_json({**SECRETS, REFRESH_TOKEN_FIELD: "outdated_refresh_token", EXPIRATION_TIME_FIELD: time.time()})
+    )
+    secrets_storage = SecretsStorage(base_configuration, logger)
+    secrets = {**SECRETS, EXPIRATION_TIME_FIELD: access_token_expiry_time}
     secrets_storage.set_secrets(secrets)
-    with open(SECRETS_JSON_PATH, encoding="UTF-8") as secrets_store:
-        secrets_data = json.load(secrets_store)
-    assert secrets_data["zoom.refresh_token"] == "xyzabcaaaabbbb" and secrets_data["zoom.access_token"] == "abcdfhghhshgg", secrets_data["zoom.access_token_expiry_time"] == access_token_expiry_time
-
-
-def test_get_secrets_from_json_file():
-    """test the fetching mechanism of secret storage data when secrets storage is available."""
-    config, logger = settings()
-    secrets_storage = SecretsStorage(config, logger)
-    secrets_storage_data = secrets_storage.get_secrets()
-    with open(SECRETS_JSON_PATH, encoding="UTF-8") as secrets_store:
-        secrets_data = json.load(secrets_store)
-    assert secrets_data == secrets_storage_data
+    assert read_secrets(secrets_file) == secrets
+
+
+def test_get_secrets_from_json_file(secrets_file, base_configuration, access_token_expiry_time):
+    """test the fetching mechanism of secret storage data when secrets storage is available.
+    :param secrets_file: path of the secrets storage file.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param access_token_expiry_time: expiration time of a valid access token.
+    """
+    secrets = {**SECRETS, EXPIRATION_TIME_FIELD: access_token_expiry_time}
+    secrets_file.write_bytes(dump_json(secrets))
+    secrets_storage = SecretsStorage(base_configuration, logger)
+    assert secrets_storage.get_secrets() == secrets
+
+
+def test_get_secrets_when_json_file_empty(secrets_file, base_configuration):
+    """test the fetching mechanism of secret storage data when secrets storage is empty.
+    :param secrets_file: path of the empty secrets storage file.
+    :param base_configuration: Configuration instance shared by the test session.
+    """
+    secrets_file.write_bytes(b"")
+    secrets_storage = SecretsStorage(base_configuration, logger)
+    assert secrets_storage.get_secrets() is None
@@ -0,0 +1,130 @@
+#
+# Copyright Elasticsearch B.V. and/or licensed to Elasticsearch B.V. under one
+# or more contributor license agreements. Licensed under the Elastic License 2.0;
+# you may not use this file except in compliance with the Elastic License 2.0.
+#
+from unittest import mock
+
+import pytest
+
+from ees_zoom.constant import BATCH_SIZE
+from ees_zoom.sync_zoom import MULTITHREADED_OBJECTS_FOR_DELETION, SyncZoom
+from ees_zoom.zoom_meetings import ZoomMeetings
+from ees_zoom.zoom_past_meetings import ZoomPastMeetings
+from ees_zoom.zoom_recordings import ZoomRecordings
+from support import (ZOOM_ENTERPRISE_SEARCH_MAPPINGS, InMemoryConnectorQueue,
+                     get_test_logger)
+
+USERS_DATA = [{"id": "dummy_id_1"}, {"id": "dummy_id_2"}]
+TIME_RANGE = ("2020-05-11T06:20:41Z", "2020-06-11T06:20:41Z")
+OBJECTS_TIME_RANGE = {"past_meetings": TIME_RANGE, "recordings": TIME_RANGE}
+# enough documents of each object type for a full chunk and a partial one.
+DOCUMENTS_COUNT = BATCH_SIZE + BATCH_SIZE // 2
+PAST_MEETINGS_DOCUMENTS = [
+    {
+        "type": "past_meetings",
+        "id": f"dummy_uuid_{index}",
+        "parent_id": str(index),
+        "created_at": "2020-06-10T06:00:00Z",
+        "title": "dummy meeting",
+    }
+    for index in range(DOCUMENTS_COUNT)
+]
+RECORDINGS_DOCUMENTS = [
+    {
+        "type": "recordings",
+        "id": f"dummy_uuid_dummy_recording_id{index}",
+        "parent_id": "dummy_id_1",
+        "created_at": "2020-06-10T06:00:00Z",
+        "title": "dummy recording",
+    }
+    for index in range(DOCUMENTS_COUNT)
+]
+
+logger = get_test_logger("unit_test_sync_zoom")
+
+
+@pytest.fixture
+def sync_zoom_object(base_configuration, zoom_client):
+    """This fixture creates the SyncZoom object of a test, syncing only past-meetings and recordings.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param zoom_client: Instance of ZoomClient with a valid access token for the test.
+    :returns SyncZoom: Instance of SyncZoom.
+    """
+    sync_zoom_object = SyncZoom(
+        base_configuration,
+        logger,
+        None,
+        zoom_client,
+        OBJECTS_TIME_RANGE,
+        InMemoryConnectorQueue(logger),
+        ZOOM_ENTERPRISE_SEARCH_MAPPINGS,
+    )
+    sync_zoom_object.configuration_objects = {"past_meetings": None, "recordings": None}
+    return sync_zoom_object
+
+
+def expected_ids_storage(documents):
+    """Builds the locally stored details expected for the documents.
+    :param documents: list of documents generated for the zoom objects.
+    :returns: list of dictionary containing the properties (id, type, parent_id, created_at) of the documents.
+    """
+    return [
+        {
+            "id": document["id"],
+            "type": document["type"],
+            "parent_id": document["parent_id"],
+            "created_at": document["created_at"],
+        }
+        for document in documents
+    ]
+
+
+@mock.patch.object(ZoomRecordings, "iter_recordings_details_documents")
+@mock.patch.object(ZoomPastMeetings, "iter_past_meetings_details_documents")
+@mock.patch.object(ZoomMeetings, "get_meetings_details_documents")
+def test_perform_sync_streams_past_meetings_and_recordings_in_chunks(
+    mock_meetings, mock_past_meetings, mock_recordings, sync_zoom_object
+):
+    """Test that the streamed past-meetings and recordings documents are queued in chunks of at most
+    BATCH_SIZE documents and that their locally stored details are returned.
+    :param mock_meetings: patch object for get_meetings_details_documents
+    :param mock_past_meetings: patch object for iter_past_meetings_details_documents
+    :param mock_recordings: patch object for iter_recordings_details_documents
+    :param sync_zoom_object: Instance of SyncZoom.
+    """
+    mock_meetings.return_value = {"type": "meetings", "data": []}
+    mock_past_meetings.return_value = iter(PAST_MEETINGS_DOCUMENTS)
+    mock_recordings.return_value = iter(RECORDINGS_DOCUMENTS)
+
+    ids_storage = sync_zoom_object.perform_sync("users", USERS_DATA)
+
+    queued_chunks = [item["data"] for item in sync_zoom_object.queue.items]
+    assert queued_chunks == [
+        PAST_MEETINGS_DOCUMENTS[:BATCH_SIZE],
+        PAST_MEETINGS_DOCUMENTS[BATCH_SIZE:],
+        RECORDINGS_DOCUMENTS[:BATCH_SIZE],
+        RECORDINGS_DOCUMENTS[BATCH_SIZE:],
+    ]
+    assert ids_storage == expected_ids_storage(PAST_MEETINGS_DOCUMENTS + RECORDINGS_DOCUMENTS)
+    mock_recordings.assert_called_once_with(
+        users_data=USERS_DATA,
+        recordings_schema=sync_zoom_object.get_schema_fields("recordings"),
+        start_time=TIME_RANGE[0],
+        end_time=TIME_RANGE[1],
+        enable_permission=sync_zoom_object.enable_permission,
+    )
+
+
+@mock.patch.object(ZoomRecordings, "iter_recordings_details_documents")
+def test_perform_sync_for_deletion_does_not_queue_recordings(mock_recordings, sync_zoom_object):
+    """Test that the recordings streamed for the deletion sync are only returned as locally stored details.
+    :param mock_recordings: patch object for iter_recordings_details_documents
+    :param sync_zoom_object: Instance of SyncZoom.
+    """
+    mock_recordings.return_value = iter(RECORDINGS_DOCUMENTS)
+
+    ids_storage = sync_zoom_object.perform_sync(MULTITHREADED_OBJECTS_FOR_DELETION, USERS_DATA)
+
+    assert sync_zoom_object.queue.empty()
+    assert ids_storage == expected_ids_storage(RECORDINGS_DOCUMENTS)
@@ -4,65 +4,51 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 
-import os
-import sys
+from collections import Counter
+from datetime import datetime
+from itertools import chain
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from ees_zoom.utils import (  # noqa
+import pytest
+
+from ees_zoom.utils import (
+    get_schema_projection,
+    parse_rfc_3339_datetime,
     split_by_max_cumulative_length,
     split_documents_into_equal_chunks,
+    split_iterable_into_buckets,
+    split_iterable_into_chunks,
     split_list_into_buckets,
     url_encode,
 )
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
+@pytest.mark.parametrize(
+    "documents, total_bucket",
+    [
+        ([1, 2, 3, 4, 5, 6, 7, 8, 10], 3),
+        ([1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 4, 1, 3, 3, 2], 3),
+        ([1, 2, 3, 4, 5, 6, 7, 8, 1, 4, 1], 3),
+    ],
+    ids=["even_bucket", "duplicate_values", "uneven_bucket"],
 )
-
-
-def test_split_list_into_buckets():
-    """Test that divide large number of documents amongst the total buckets."""
-    documents = [1, 2, 3, 4, 5, 6, 7, 8, 10]
-    total_bucket = 3
+def test_split_list_into_buckets(documents, total_bucket):
+    """Test that divide large number of documents amongst the total buckets, with duplicate values
+    and uneven buckets.
+    :param documents: list of documents to divide.
+    :param total_bucket: number of buckets to divide the documents into.
+    """
     target_list = split_list_into_buckets(documents, total_bucket)
-    count = 0
-    for id_list in target_list:
-        for id in id_list:
-            if id in documents:
-                count += 1
-    assert len(documents) == count
+    assert Counter(chain.from_iterable(target_list)) == Counter(documents)
     assert total_bucket == len(target_list)
 
 
-def test_split_list_into_buckets_for_duplicate_values():
-    """Test that divide large number of documents amongst the total buckets for duplicate values."""
-    documents = [1, 2, 3, 4, 5, 6, 7, 8, 9, 1, 4, 1, 3, 3, 2]
-    total_bucket = 3
-    target_list = split_list_into_buckets(documents, total_bucket)
-    count = 0
-    for id_list in target_list:
-        for id in id_list:
-            if id in documents:
-                count += 1
-    assert len(documents) == count
-    assert total_bucket == len(target_list)
-
-
-def test_split_list_into_buckets_for_uneven_bucket():
-    """Test that divide large number of documents amongst the total uneven buckets."""
-    documents = [1, 2, 3, 4, 5, 6, 7, 8, 1, 4, 1]
-    total_bucket = 3
-    target_list = split_list_into_buckets(documents, total_bucket)
-    count = 0
-    for id_list in target_list:
-        for id in id_list:
-            if id in documents:
-                count += 1
-    assert len(documents) == count
-    assert total_bucket == len(target_list)
+def test_split_iterable_into_buckets():
+    """Test that divide documents consumed from an iterable amongst the total buckets."""
+    documents = [1, 2, 3, 4, 5, 6, 7, 8, 10]
+    total_bucket = 4
+    target_list = split_iterable_into_buckets(iter(documents), total_bucket)
+    assert target_list == split_list_into_buckets(documents, total_bucket)
+    assert split_iterable_into_buckets(iter([1, 2]), total_bucket) == [[1], [2]]
 
 
 def test_url_encode():
@@ -84,6 +70,15 @@ def test_split_documents_into_equal_chunks():
     assert expected_result == result
 
 
+def test_split_iterable_into_chunks():
+    """Tests split_iterable_into_chunks lazily splits an iterable into chunks of at most chunk_size"""
+    documents_to_split = (str(document) for document in range(7))
+    chunk_size = 3
+    expected_result = [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+    result = split_iterable_into_chunks(documents_to_split, chunk_size)
+    assert expected_result == list(result)
+
+
 def test_split_by_max_cumulative_length_with_lowest_possible_size():
     """Tests split functionality based on size"""
     document_to_split = [
@@ -132,3 +127,33 @@ def test_split_by_max_cumulative_length_with_optimum_size():
     ]
     returned_document = split_by_max_cumulative_length(document_to_split, allowed_size)
     assert returned_document == expected_output
+
+
+def test_get_schema_projection():
+    """Tests get_schema_projection projects the Zoom fields into the Enterprise Search fields"""
+    zoom_object = {"id": "dummy_id", "name": "dummy_name", "total_members": 1}
+    project = get_schema_projection({"id": "id", "title": "name"})
+    assert project(zoom_object) == {"id": "dummy_id", "title": "dummy_name"}
+    project = get_schema_projection({"id": "id"})
+    assert project(zoom_object) == {"id": "dummy_id"}
+    project = get_schema_projection({})
+    assert project(zoom_object) == {}
+
+
+def test_parse_rfc_3339_datetime():
+    """Tests parse_rfc_3339_datetime parses rfc 3339 datetime strings same as strptime"""
+    assert parse_rfc_3339_datetime("2020-06-10T06:05:09Z") == datetime(2020, 6, 10, 6, 5, 9)
+    assert parse_rfc_3339_datetime("2020-6-10T06:05:09Z") == datetime(2020, 6, 10, 6, 5, 9)
+
+
+@pytest.mark.parametrize(
+    "date_string",
+    ["2020x05x11T06:20:41Z", "2020-05-11T 6:20:41Z", "2020-05-11T06.20.41Z", "2020-05-1+T06:20:41Z", "2020-02-30T06:20:41Z"],
+    ids=["date_separators", "space_padded_hour", "time_separators", "signed_day", "invalid_day"],
+)
+def test_parse_rfc_3339_datetime_rejects_malformed_strings(date_string):
+    """Tests parse_rfc_3339_datetime rejects the malformed datetime strings that strptime rejects.
+    :param date_string: malformed datetime string.
+    """
+    with pytest.raises(ValueError):
+        parse_rfc_3339_datetime(date_string)
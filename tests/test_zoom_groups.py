@@ -4,46 +4,28 @@
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
 
-import logging
-import os
-import sys
-import time
-
 import pytest
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from ees_zoom.configuration import Configuration
 from ees_zoom.constant import GROUPS
-from ees_zoom.zoom_client import ZoomClient
 from ees_zoom.zoom_groups import ZoomGroups
+from support import get_test_logger
 
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
 SCHEMA = {
     "id": "id",
     "title": "name",
 }
 
+logger = get_test_logger("unit_test_groups")
 
-def settings():
-    """This function loads configuration from the file and initialize logger.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
-    """
-    configuration = Configuration(file_name=CONFIG_FILE)
-    logger = logging.getLogger("unit_test_groups")
-    return configuration, logger
 
-
-def create_zoom_groups_object():
-    """This function creates zoom_groups object for test."""
-    configs, logger = settings()
-    zoom_client = ZoomClient(configs, logger)
-    zoom_client.access_token = "dummy"
-    zoom_client.access_token_expiration = time.time() + 4000
-    return ZoomGroups(configs, logger, zoom_client)
+@pytest.fixture
+def groups_object(base_configuration, zoom_client):
+    """This fixture creates the ZoomGroups object of a test.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param zoom_client: Instance of ZoomClient with a valid access token for the test.
+    :returns ZoomGroups: Instance of ZoomGroups.
+    """
+    return ZoomGroups(base_configuration, logger, zoom_client)
 
 
 @pytest.mark.parametrize(
@@ -72,13 +54,13 @@ def create_zoom_groups_object():
         )
     ],
 )
-def test_get_groups_details(requests_mock, groups_list, groups_details_response_data):
+def test_get_groups_details(requests_mock, groups_list, groups_details_response_data, groups_object):
     """Test that delete objects from Enterprise Search.
     :param requests_mock: fixture for mocking requests calls.
     :param groups_list: list of groups data.
     :param groups_details_response_data: document generated for fetched groups.
+    :param groups_object: Instance of ZoomGroups.
     """
-    groups_object = create_zoom_groups_object()
     headers = {
         "authorization": "Bearer token",
         "content-type": "application/json",
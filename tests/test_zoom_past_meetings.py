@@ -3,88 +3,39 @@
 # or more contributor license agreements. Licensed under the Elastic License 2.0;
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
-import datetime
-import json
-import logging
-import os
-import sys
-import time
-from unittest import mock
-from unittest.mock import Mock
 
+import orjson
 import pytest
-import requests
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom.utils import parse_rfc_3339_datetime
+from ees_zoom.zoom_past_meetings import ZoomPastMeetings
+from support import ZOOM_ENTERPRISE_SEARCH_MAPPINGS, dump_json, get_test_logger
 
-from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.constant import RFC_3339_DATETIME_FORMAT  # noqa
-from ees_zoom.zoom_client import ZoomClient  # noqa
-from ees_zoom.zoom_past_meetings import ZoomPastMeetings  # noqa
-
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
-PAST_MEETINGS = "past_meetings"
+PAST_MEETING_URL = "https://api.zoom.us/v2/past_meetings/1231231123"
+PARTICIPANTS_URL = "https://api.zoom.us/v2/report/meetings/1231231123/participants"
 SCHEMA = {
     "created_at": "start_time",
     "id": "uuid",
     "title": "topic",
 }
-
-
-def settings():
-    """This Method loads configuration from the file and initialize logger.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
-    :returns zoom_enterprise_search_mappings: dictionary containing mappings from zoom_user_id to enterprise_user_id
-    """
-    configuration = Configuration(file_name=CONFIG_FILE)
-    zoom_enterprise_search_mappings = {
-        "dummy_id_1": ["ent_dummy_id_1", "ent_dummy_id_1_2"],
-        "dummy_id_2": ["ent_dummy_id_2"],
+START_TIME = parse_rfc_3339_datetime("2020-05-11T06:20:41Z")
+END_TIME = parse_rfc_3339_datetime("2020-06-11T06:20:41Z")
+DUMMY_MEETINGS_DATA = [
+    {
+        "uuid": "dummy_uuid_1",
+        "id": 1231231123,
+        "host_id": "dummy_id_1",
+        "topic": "its dummy meeting2",
+        "type": 1,
+        "start_time": "2020-06-10T06:00:00Z",
+        "duration": 120,
+        "timezone": "Planet/Earth",
+        "created_at": "2020-06-09T05:46:28Z",
+        "join_url": "https://dummy.com/meetings/mydummy_2",
     }
-    logger = logging.getLogger("unit_test_past_meetings")
-    return configuration, logger, zoom_enterprise_search_mappings
-
-
-def create_past_meetings_object():
-    """This Method create ZoomPastMeeting object for test.
-    :returns ZoomPastMeetings: Instance of ZoomPastMeetings.
-    """
-    configs, logger, zoom_enterprise_search_mappings = settings()
-    zoom_client = ZoomClient(configs, logger)
-    zoom_client.access_token = "dummy"
-    zoom_client.access_token_expiration = time.time() + 4000
-    return ZoomPastMeetings(
-        configs, logger, zoom_client, zoom_enterprise_search_mappings
-    )
-
-
-@mock.patch("requests.get")
-def test_get_past_meetings_details_documents_positive(mock_request_get):
-    """Test for generating past-meetings documents,using data fetched from Zoom.
-    this case covers scenario where there are more than one participants.
-    :param requests_mock: fixture for requests.get calls.
-    """
-
-    past_meetings_object = create_past_meetings_object()
-    dummy_meetings_data = [
-        {
-            "uuid": "dummy_uuid_1",
-            "id": 1231231123,
-            "host_id": "dummy_id_1",
-            "topic": "its dummy meeting2",
-            "type": 1,
-            "start_time": "2020-06-10T06:00:00Z",
-            "duration": 120,
-            "timezone": "Planet/Earth",
-            "created_at": "2020-06-09T05:46:28Z",
-            "join_url": "https://dummy.com/meetings/mydummy_2",
-        }
-    ]
-    dummy_past_meetings_data = {
+]
+DUMMY_PAST_MEETINGS_DATA = dump_json(
+    {
         "uuid": "dummy_uuid_1",
         "id": 1231231123,
         "host_id": "dummy_id_1",
@@ -100,7 +51,9 @@ def test_get_past_meetings_details_documents_positive(mock_request_get):
         "dept": "",
         "source": "Dummy institute",
     }
-    dummy_participants_data_with_next_page_token = {
+)
+DUMMY_PARTICIPANTS_DATA_WITH_NEXT_PAGE_TOKEN = dump_json(
+    {
         "page_count": 1,
         "page_size": 300,
         "total_records": 2,
@@ -121,7 +74,9 @@ def test_get_past_meetings_details_documents_positive(mock_request_get):
             },
         ],
     }
-    dummy_participants_data_without_next_page_token = {
+)
+DUMMY_PARTICIPANTS_DATA_WITHOUT_NEXT_PAGE_TOKEN = dump_json(
+    {
         "page_count": 2,
         "page_size": 300,
         "total_records": 2,
@@ -142,6 +97,50 @@ def test_get_past_meetings_details_documents_positive(mock_request_get):
             },
         ],
     }
+)
+
+logger = get_test_logger("unit_test_past_meetings")
+
+
+@pytest.fixture
+def past_meetings_object(base_configuration, zoom_client):
+    """This fixture creates the ZoomPastMeetings object of a test.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param zoom_client: Instance of ZoomClient with a valid access token for the test.
+    :returns ZoomPastMeetings: Instance of ZoomPastMeetings.
+    """
+    return ZoomPastMeetings(base_configuration, logger, zoom_client, ZOOM_ENTERPRISE_SEARCH_MAPPINGS)
+
+
+@pytest.mark.parametrize(
+    "participants_responses, expected_participants",
+    [
+        pytest.param(
+            [
+                {"content": DUMMY_PARTICIPANTS_DATA_WITH_NEXT_PAGE_TOKEN, "status_code": 200},
+                {"content": DUMMY_PARTICIPANTS_DATA_WITHOUT_NEXT_PAGE_TOKEN, "status_code": 200},
+            ],
+            "[{'id': 'dummy_participant_id1', 'name': 'dummy_user_1', 'join_time': '1111-11-11T11:11:11Z', 'leave_time': '1111-11-11T12:11:11Z', 'duration': 1111}, {'id': 'dummy_participant_id2', 'name': 'dummy_user_2', 'join_time': '1111-11-11T11:11:11Z', 'leave_time': '1111-11-11T12:11:11Z', 'duration': 2222}]",
+            id="many_participants",
+        ),
+        pytest.param(
+            [{"status_code": 404}],
+            "[{'id': 'dummy_id_1', 'name': 'dummy username 1', 'join_time': '2020-06-10T06:00:00Z', 'leave_time': '2020-05-12T06:20:41Z', 'duration': 120}]",
+            id="host_only_participant",
+        ),
+    ],
+)
+def test_iter_past_meetings_details_documents_positive(
+    requests_mock, past_meetings_object, participants_responses, expected_participants
+):
+    """Test for generating past-meetings documents,using data fetched from Zoom.
+    The cases cover the scenarios where there are more than one participants and where the meeting host is
+    the only participant, Zoom answers 404 for the participants of such a meeting.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param past_meetings_object: Instance of ZoomPastMeetings.
+    :param participants_responses: responses of the participants endpoint, one per page.
+    :param expected_participants: participants expected in the body of the document.
+    """
     expected_response = [
         {
             "type": "past_meetings",
@@ -149,195 +148,88 @@ def test_get_past_meetings_details_documents_positive(mock_request_get):
             "created_at": "2020-06-10T06:00:00Z",
             "id": "dummy_uuid_1",
             "title": "its dummy meeting2",
-            "body": "Meeting Duration:120\nMeeting Type:An instant meeting\nMeeting Participants : [{'id': 'dummy_participant_id1', 'name': 'dummy_user_1', 'join_time': '1111-11-11T11:11:11Z', 'leave_time': '1111-11-11T12:11:11Z', 'duration': 1111}, {'id': 'dummy_participant_id2', 'name': 'dummy_user_2', 'join_time': '1111-11-11T11:11:11Z', 'leave_time': '1111-11-11T12:11:11Z', 'duration': 2222}]",
+            "body": f"Meeting Duration:120\nMeeting Type:An instant meeting\nMeeting Participants : {expected_participants}",
             "url": "https://zoom.us/user/dummy_id_1/meeting/1231231123",
             "_allow_permissions": ["User:Read", "ent_dummy_id_1", "ent_dummy_id_1_2"],
         }
     ]
-    start_time = datetime.datetime.strptime(
-        "2020-05-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    end_time = datetime.datetime.strptime(
-        "2020-06-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    enable_permission = True
-    dummy_past_meetings_data = json.dumps(dummy_past_meetings_data)
-    dummy_participants_data_with_next_page_token = json.dumps(
-        dummy_participants_data_with_next_page_token
-    )
-    dummy_participants_data_without_next_page_token = json.dumps(
-        dummy_participants_data_without_next_page_token
-    )
-    mock_response = [Mock(), Mock(), Mock()]
-    mock_response[0].status_code = 200
-    mock_response[0].text = dummy_past_meetings_data
-    mock_response[1].status_code = 200
-    mock_response[1].text = dummy_participants_data_with_next_page_token
-    mock_response[2].status_code = 200
-    mock_response[2].text = dummy_participants_data_without_next_page_token
-    mock_request_get.side_effect = mock_response
-    response = past_meetings_object.get_past_meetings_details_documents(
-        dummy_meetings_data,
+    requests_mock.get(PAST_MEETING_URL, content=DUMMY_PAST_MEETINGS_DATA)
+    requests_mock.get(PARTICIPANTS_URL, participants_responses)
+    documents = past_meetings_object.iter_past_meetings_details_documents(
+        DUMMY_MEETINGS_DATA,
         SCHEMA,
-        start_time,
-        end_time,
-        enable_permission,
+        START_TIME,
+        END_TIME,
+        True,
     )
-    assert response["type"] == PAST_MEETINGS
-    assert response["data"] == expected_response
+    assert list(documents) == expected_response
 
 
-@mock.patch("requests.get")
-def test_get_past_meetings_details_documents_negative(mock_request_get):
+def test_iter_past_meetings_details_documents_negative(requests_mock, past_meetings_object):
     """test case where meeting id is not past-meeting or Zoom is down.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param past_meetings_object: Instance of ZoomPastMeetings.
     """
-    dummy_meetings_data = [
-        {
-            "uuid": "dummy_uuid_1",
-            "id": 1231231123,
-            "host_id": "dummy_id_1",
-            "topic": "its dummy meeting2",
-            "type": 1,
-            "start_time": "2020-06-10T06:00:00Z",
-            "duration": 120,
-            "timezone": "Planet/Earth",
-            "created_at": "2020-06-09T05:46:28Z",
-            "join_url": "https://dummy.com/meetings/mydummy_2",
-        }
-    ]
-    start_time = datetime.datetime.strptime(
-        "2020-05-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    end_time = datetime.datetime.strptime(
-        "2020-06-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    enable_permission = True
-    past_meetings_object = create_past_meetings_object()
-    mock_response = mock.Mock()
-    mock_response.status_code = 500
-    mock_response.raise_for_status = mock.Mock()
-    raise_for_status = requests.exceptions.HTTPError
-    mock_response.raise_for_status.side_effect = raise_for_status
-    mock_request_get.return_value = mock_response
+    requests_mock.get(PAST_MEETING_URL, status_code=500)
     with pytest.raises(BaseException):
-        past_meetings_object.get_past_meetings_details_documents(
-            dummy_meetings_data,
-            SCHEMA,
-            start_time,
-            end_time,
-            enable_permission,
+        list(
+            past_meetings_object.iter_past_meetings_details_documents(
+                DUMMY_MEETINGS_DATA,
+                SCHEMA,
+                START_TIME,
+                END_TIME,
+                True,
+            )
         )
 
 
-@mock.patch("requests.get")
-def test_get_past_meetings_details_documents_with_one_participant(mock_request_get):
-    """Test for generating past-meetings documents,using data fetched from Zoom.
-    this case covers scenario where meeting host is the only participant.
-    :param mock_request_get: fixture for requests.get calls.
-    """
-
-    past_meetings_object = create_past_meetings_object()
-    dummy_meetings_data = [
-        {
-            "uuid": "dummy_uuid_1",
-            "id": 1231231123,
-            "host_id": "dummy_id_1",
-            "topic": "its dummy meeting2",
-            "type": 1,
-            "start_time": "2020-06-10T06:00:00Z",
-            "duration": 120,
-            "timezone": "Planet/Earth",
-            "created_at": "2020-06-09T05:46:28Z",
-            "join_url": "https://dummy.com/meetings/mydummy_2",
-        }
-    ]
-    dummy_past_meetings_data = {
-        "uuid": "dummy_uuid_1",
-        "id": 1231231123,
-        "host_id": "dummy_id_1",
-        "type": 1,
-        "topic": "its dummy meeting2",
-        "user_name": "dummy username 1",
-        "user_email": "dummy@dumb.com",
-        "start_time": "2020-06-10T06:00:00Z",
-        "end_time": "2020-05-12T06:20:41Z",
-        "duration": 120,
-        "total_minutes": 222,
-        "participants_count": 231,
-        "dept": "",
-        "source": "Dummy institute",
-    }
-    expected_response = [
-        {
-            "type": "past_meetings",
-            "parent_id": "1231231123",
-            "created_at": "2020-06-10T06:00:00Z",
-            "id": "dummy_uuid_1",
-            "title": "its dummy meeting2",
-            "body": "Meeting Duration:120\nMeeting Type:An instant meeting\nMeeting Participants : [{'id': 'dummy_id_1', 'name': 'dummy username 1', 'join_time': '2020-06-10T06:00:00Z', 'leave_time': '2020-05-12T06:20:41Z', 'duration': 120}]",
-            "url": "https://zoom.us/user/dummy_id_1/meeting/1231231123",
-            "_allow_permissions": ["User:Read", "ent_dummy_id_1", "ent_dummy_id_1_2"],
-        }
-    ]
-    start_time = datetime.datetime.strptime(
-        "2020-05-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    end_time = datetime.datetime.strptime(
-        "2020-06-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    enable_permission = True
-    dummy_past_meetings_data = json.dumps(dummy_past_meetings_data)
-    mock_response = [Mock(), Mock()]
-    mock_response[0].status_code = 200
-    mock_response[0].text = dummy_past_meetings_data
-    mock_resp = requests.models.Response()
-    mock_resp.status_code = 404
-    exception_mock = requests.exceptions.HTTPError(response=mock_resp)
-    exception_mock.response = mock.MagicMock()
-    exception_mock.response.status_code = 404
-    mock_response[1] = exception_mock
-    mock_request_get.side_effect = mock_response
-    response = past_meetings_object.get_past_meetings_details_documents(
-        dummy_meetings_data,
-        SCHEMA,
-        start_time,
-        end_time,
-        enable_permission,
-    )
-    assert response["type"] == PAST_MEETINGS
-    assert response["data"] == expected_response
-
-
-@mock.patch("requests.get")
-def test_get_past_meeting_details_from_meeting_id_negative(mock_request_get):
+def test_get_past_meeting_details_from_meeting_id_negative(requests_mock, past_meetings_object):
     """test case to handle 400 status code.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param past_meetings_object: Instance of ZoomPastMeetings.
     """
     # Setup
-    past_meetings_object = create_past_meetings_object()
-    start_time = datetime.datetime.strptime(
-        "2020-05-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    end_time = datetime.datetime.strptime(
-        "2020-06-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
     meeting_id = "123123123"
-    dummy_response = {'code': 3001, 'message': 'Meeting does not exist: 123123123.'}
-    dummy_response = json.dumps(dummy_response)
-    mock_resp = requests.models.Response()
-    mock_resp.status_code = 400
-    exception_mock = requests.exceptions.HTTPError(response=mock_resp)
-    exception_mock.response = mock.MagicMock()
-    exception_mock.response.status_code = 400
-    exception_mock.response.content = "Error Code"
-    exception_mock.response.text = dummy_response
-    mock_request_get().raise_for_status.side_effect = exception_mock
+    requests_mock.get(
+        f"https://api.zoom.us/v2/past_meetings/{meeting_id}",
+        status_code=400,
+        json={"code": 3001, "message": "Meeting does not exist: 123123123."},
+    )
     # Execute
     response = past_meetings_object.get_past_meeting_details_from_meeting_id(
         meeting_id,
-        start_time,
-        end_time,
+        START_TIME,
+        END_TIME,
     )
     # Assert
     assert response is None
+
+
+def test_iter_past_meetings_details_documents_skips_participants_out_of_time_range(
+    requests_mock, past_meetings_object
+):
+    """Test that the participants are fetched only for the past-meetings ending in the time range.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param past_meetings_object: Instance of ZoomPastMeetings.
+    """
+    out_of_range_meeting = {**DUMMY_MEETINGS_DATA[0], "id": 4564564456}
+    requests_mock.get(
+        "https://api.zoom.us/v2/past_meetings/4564564456",
+        content=dump_json({**orjson.loads(DUMMY_PAST_MEETINGS_DATA), "end_time": "2021-05-12T06:20:41Z"}),
+    )
+    out_of_range_participants = requests_mock.get(
+        "https://api.zoom.us/v2/report/meetings/4564564456/participants", status_code=404
+    )
+    requests_mock.get(PAST_MEETING_URL, content=DUMMY_PAST_MEETINGS_DATA)
+    requests_mock.get(PARTICIPANTS_URL, content=DUMMY_PARTICIPANTS_DATA_WITHOUT_NEXT_PAGE_TOKEN)
+    documents = list(
+        past_meetings_object.iter_past_meetings_details_documents(
+            [out_of_range_meeting, *DUMMY_MEETINGS_DATA],
+            SCHEMA,
+            START_TIME,
+            END_TIME,
+            False,
+        )
+    )
+    assert [document["parent_id"] for document in documents] == ["1231231123"]
+    assert not out_of_range_participants.called
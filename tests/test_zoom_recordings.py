@@ -3,30 +3,14 @@
 # or more contributor license agreements. Licensed under the Elastic License 2.0;
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
-import datetime
-import json
-import logging
-import os
-import sys
-import time
-from unittest import mock
-from unittest.mock import Mock
 
 import pytest
-import requests
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from ees_zoom.utils import parse_rfc_3339_datetime
+from ees_zoom.zoom_recordings import ZoomRecordings
+from support import ZOOM_ENTERPRISE_SEARCH_MAPPINGS, dump_json, get_test_logger
 
-from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.constant import RFC_3339_DATETIME_FORMAT  # noqa
-from ees_zoom.zoom_client import ZoomClient  # noqa
-from ees_zoom.zoom_recordings import ZoomRecordings  # noqa
-
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
-RECORDING = "recordings"
+RECORDINGS_URL = "https://api.zoom.us/v2/users/dummy_id_1/recordings"
 SCHEMA = {
     "created_at": "recording_start",
     "id": "id",
@@ -34,63 +18,31 @@ SCHEMA = {
     "title": "topic",
     "url": "play_url",
 }
-
-
-def settings():
-    """This function loads configuration from the file and initialize logger.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
-    :returns zoom_enterprise_search_mappings: dictionary containing mappings from zoom_user_id to enterprise_user_id
-    """
-    configuration = Configuration(file_name=CONFIG_FILE)
-    zoom_enterprise_search_mappings = {
-        "dummy_id_1": ["ent_dummy_id_1", "ent_dummy_id_1_2"],
-        "dummy_id_2": ["ent_dummy_id_2"],
+START_TIME = parse_rfc_3339_datetime("2020-05-11T06:20:41Z")
+END_TIME = parse_rfc_3339_datetime("2020-06-11T06:20:41Z")
+DUMMY_USERS_DATA = [
+    {
+        "id": "dummy_id_1",
+        "first_name": "user1",
+        "last_name": "abc",
+        "email": "dummy@dummy.com",
+        "type": 2,
+        "pmi": 12341234,
+        "timezone": "Planet/Earth",
+        "verified": 1,
+        "dept": "",
+        "created_at": "2020-05-11T06:20:41Z",
+        "last_login_time": "2222-22-22T22:22:22Z",
+        "last_client_version": "5.9.1.3506(mac)",
+        "pic_url": "https://dummy_user_id1_url.com/",
+        "language": "en-US",
+        "phone_number": "",
+        "status": "Passive",
+        "role_id": "0",
     }
-    logger = logging.getLogger("unit_test_recording")
-    return configuration, logger, zoom_enterprise_search_mappings
-
-
-def create_recordings_object():
-    """This function create ZoomRecordings object for test.
-    :returns ZoomRecordings: Instance of ZoomRecordings.
-    """
-    configs, logger, zoom_enterprise_search_mappings = settings()
-    zoom_client = ZoomClient(configs, logger)
-    zoom_client.access_token = "dummy"
-    zoom_client.access_token_expiration = time.time() + 4000
-    return ZoomRecordings(configs, logger, zoom_client, zoom_enterprise_search_mappings)
-
-
-@mock.patch("requests.get")
-def test_get_recordings_details_documents_positive(mock_request_get):
-    """Test for generating recording documents, generated from data fetched from Zoom.
-    :param mock_request_get: mock patch for requests.get calls.
-    """
-    # Setup
-    recordings_object = create_recordings_object()
-    dummy_users_data = [
-        {
-            "id": "dummy_id_1",
-            "first_name": "user1",
-            "last_name": "abc",
-            "email": "dummy@dummy.com",
-            "type": 2,
-            "pmi": 12341234,
-            "timezone": "Planet/Earth",
-            "verified": 1,
-            "dept": "",
-            "created_at": "2020-05-11T06:20:41Z",
-            "last_login_time": "2222-22-22T22:22:22Z",
-            "last_client_version": "5.9.1.3506(mac)",
-            "pic_url": "https://dummy_user_id1_url.com/",
-            "language": "en-US",
-            "phone_number": "",
-            "status": "Passive",
-            "role_id": "0",
-        }
-    ]
-    mock_resp_with_next_page_token = {
+]
+MOCK_RESP_WITH_NEXT_PAGE_TOKEN = dump_json(
+    {
         "from": "2022-03-13",
         "to": "2022-04-13",
         "page_count": 1,
@@ -154,7 +106,9 @@ def test_get_recordings_details_documents_positive(mock_request_get):
             },
         ],
     }
-    mock_resp_without_next_page_token = {
+)
+MOCK_RESP_WITHOUT_NEXT_PAGE_TOKEN = dump_json(
+    {
         "from": "2022-03-13",
         "to": "2022-04-13",
         "page_count": 1,
@@ -205,161 +159,117 @@ def test_get_recordings_details_documents_positive(mock_request_get):
             },
         ],
     }
-    expected_response = [
-        {
-            "type": "recordings",
-            "parent_id": "dummy_id_1",
-            "created_at": "2022-03-22T05:53:15Z",
-            "id": "dummy_uuid_dummy_recording_id1",
-            "size": 4002224,
-            "title": "Dummy meeting Topic",
-            "url": "https://zoom.us/recording/management/detail?meeting_id=dummy_uuid",
-            "body": "File MetaData\n File Type : M4A\n File Size : 1856448\n Recording Type : audio_only",
-            "_allow_permissions": [
-                "Recording:Read",
-                "ent_dummy_id_1",
-                "ent_dummy_id_1_2",
-            ],
-        },
-        {
-            "type": "recordings",
-            "parent_id": "dummy_id_1",
-            "created_at": "2022-03-22T05:53:15Z",
-            "id": "dummy_uuid_dummy_recording_id2",
-            "size": 4002224,
-            "title": "Dummy meeting Topic",
-            "body": "File MetaData\n File Type : TIMELINE\n File Size : 544\n Recording Type : timeline",
-            "url": "https://zoom.us/recording/management/detail?meeting_id=dummy_uuid",
-            "_allow_permissions": [
-                "Recording:Read",
-                "ent_dummy_id_1",
-                "ent_dummy_id_1_2",
-            ],
-        },
-        {
-            "type": "recordings",
-            "parent_id": "dummy_id_1",
-            "created_at": "2022-03-22T05:53:15Z",
-            "id": "dummy_uuid_dummy_recording_id3",
-            "size": 4002224,
-            "title": "Dummy meeting Topic",
-            "url": "https://zoom.us/recording/management/detail?meeting_id=dummy_uuid",
-            "body": "File MetaData\n File Type : MP4\n File Size : 2145232\n Recording Type : shared_screen_with_speaker_view",
-            "_allow_permissions": [
-                "Recording:Read",
-                "ent_dummy_id_1",
-                "ent_dummy_id_1_2",
-            ],
-        },
-        {
-            "type": "recordings",
-            "parent_id": "dummy_id_1",
-            "created_at": "2022-03-23T05:53:15Z",
-            "id": "dummy_uuid2_dummy_recording_id1",
-            "size": 1233321,
-            "title": "Dummy meeting Topic 2",
-            "url": "https://zoom.us/recording/management/detail?meeting_id=dummy_uuid2",
-            "body": "File MetaData\n File Type : M4A\n File Size : 1856448\n Recording Type : audio_only",
-            "_allow_permissions": [
-                "Recording:Read",
-                "ent_dummy_id_1",
-                "ent_dummy_id_1_2",
-            ],
-        },
-        {
-            "type": "recordings",
-            "parent_id": "dummy_id_1",
-            "created_at": "2022-03-23T05:53:15Z",
-            "id": "dummy_uuid2_dummy_recording_id2",
-            "size": 1233321,
-            "title": "Dummy meeting Topic 2",
-            "body": "File MetaData\n File Type : TIMELINE\n File Size : 454\n Recording Type : timeline",
-            "url": "https://zoom.us/recording/management/detail?meeting_id=dummy_uuid2",
-            "_allow_permissions": [
-                "Recording:Read",
-                "ent_dummy_id_1",
-                "ent_dummy_id_1_2",
-            ],
-        },
-    ]
-    start_time = datetime.datetime.strptime(
-        "2020-05-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    end_time = datetime.datetime.strptime(
-        "2020-06-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
+)
+RECORDING_DOCUMENT_BASE = {
+    "type": "recordings",
+    "parent_id": "dummy_id_1",
+    "_allow_permissions": [
+        "Recording:Read",
+        "ent_dummy_id_1",
+        "ent_dummy_id_1_2",
+    ],
+}
+MEETING_1_FIELDS = {
+    "created_at": "2022-03-22T05:53:15Z",
+    "size": 4002224,
+    "title": "Dummy meeting Topic",
+    "url": "https://zoom.us/recording/management/detail?meeting_id=dummy_uuid",
+}
+MEETING_2_FIELDS = {
+    "created_at": "2022-03-23T05:53:15Z",
+    "size": 1233321,
+    "title": "Dummy meeting Topic 2",
+    "url": "https://zoom.us/recording/management/detail?meeting_id=dummy_uuid2",
+}
+EXPECTED_RESPONSE = [
+    {**RECORDING_DOCUMENT_BASE, **meeting_fields, "id": recording_id, "body": body}
+    for meeting_fields, recording_id, body in (
+        (
+            MEETING_1_FIELDS,
+            "dummy_uuid_dummy_recording_id1",
+            "File MetaData\n File Type : M4A\n File Size : 1856448\n Recording Type : audio_only",
+        ),
+        (
+            MEETING_1_FIELDS,
+            "dummy_uuid_dummy_recording_id2",
+            "File MetaData\n File Type : TIMELINE\n File Size : 544\n Recording Type : timeline",
+        ),
+        (
+            MEETING_1_FIELDS,
+            "dummy_uuid_dummy_recording_id3",
+            "File MetaData\n File Type : MP4\n File Size : 2145232\n Recording Type : shared_screen_with_speaker_view",
+        ),
+        (
+            MEETING_2_FIELDS,
+            "dummy_uuid2_dummy_recording_id1",
+            "File MetaData\n File Type : M4A\n File Size : 1856448\n Recording Type : audio_only",
+        ),
+        (
+            MEETING_2_FIELDS,
+            "dummy_uuid2_dummy_recording_id2",
+            "File MetaData\n File Type : TIMELINE\n File Size : 454\n Recording Type : timeline",
+        ),
     )
+]
+
+logger = get_test_logger("unit_test_recording")
+
+
+@pytest.fixture
+def recordings_object(base_configuration, zoom_client):
+    """This fixture creates the ZoomRecordings object of a test.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param zoom_client: Instance of ZoomClient with a valid access token for the test.
+    :returns ZoomRecordings: Instance of ZoomRecordings.
+    """
+    return ZoomRecordings(base_configuration, logger, zoom_client, ZOOM_ENTERPRISE_SEARCH_MAPPINGS)
+
+
+def test_iter_recordings_details_documents_positive(requests_mock, recordings_object):
+    """Test for generating recording documents, generated from data fetched from Zoom.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param recordings_object: Instance of ZoomRecordings.
+    """
+    # Setup
     enable_permission = True
-    mock_resp_with_next_page_token = json.dumps(mock_resp_with_next_page_token)
-    mock_resp_without_next_page_token = json.dumps(mock_resp_without_next_page_token)
-    mock_response = [Mock(), Mock()]
-    mock_response[0].status_code = 200
-    mock_response[0].text = mock_resp_with_next_page_token
-    mock_response[1].status_code = 200
-    mock_response[1].text = mock_resp_without_next_page_token
-    mock_request_get.side_effect = mock_response
+    requests_mock.get(
+        RECORDINGS_URL,
+        [
+            {"content": MOCK_RESP_WITH_NEXT_PAGE_TOKEN, "status_code": 200},
+            {"content": MOCK_RESP_WITHOUT_NEXT_PAGE_TOKEN, "status_code": 200},
+        ],
+    )
 
     # Execute
-    response = recordings_object.get_recordings_details_documents(
-        dummy_users_data,
+    documents = recordings_object.iter_recordings_details_documents(
+        DUMMY_USERS_DATA,
         SCHEMA,
-        start_time,
-        end_time,
+        START_TIME,
+        END_TIME,
         enable_permission,
     )
 
     # Assert
-    assert response["type"] == RECORDING
-    assert response["data"] == expected_response
+    assert list(documents) == EXPECTED_RESPONSE
 
 
-@mock.patch("requests.get")
-def test_get_recordings_details_documents_negative(mock_request_get):
+def test_iter_recordings_details_documents_negative(requests_mock, recordings_object):
     """test case where Zoom is down
-    :param mock_request_get: mock patch for requests.get calls.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param recordings_object: Instance of ZoomRecordings.
     """
     # Setup
-    dummy_users_data = [
-        {
-            "id": "dummy_id_1",
-            "first_name": "user1",
-            "last_name": "abc",
-            "email": "dummy@dummy.com",
-            "type": 2,
-            "pmi": 12341234,
-            "timezone": "Planet/Earth",
-            "verified": 1,
-            "dept": "",
-            "created_at": "2020-05-11T06:20:41Z",
-            "last_login_time": "2222-22-22T22:22:22Z",
-            "last_client_version": "5.9.1.3506(mac)",
-            "pic_url": "https://dummy_user_id1_url.com/",
-            "language": "en-US",
-            "phone_number": "",
-            "status": "Passive",
-            "role_id": "0",
-        }
-    ]
-    start_time = datetime.datetime.strptime(
-        "2020-05-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    end_time = datetime.datetime.strptime(
-        "2020-06-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
     enable_permission = True
-    recordings_object = create_recordings_object()
-    mock_response = mock.Mock()
-    mock_response.status_code = 500
-    mock_response.raise_for_status = mock.Mock()
-    raise_for_status = requests.exceptions.HTTPError
-    mock_response.raise_for_status.side_effect = raise_for_status
-    mock_request_get.return_value = mock_response
+    requests_mock.get(RECORDINGS_URL, status_code=500)
 
     # Execute and assert
     with pytest.raises(BaseException):
-        recordings_object.get_recordings_details_documents(
-            dummy_users_data,
-            SCHEMA,
-            start_time,
-            end_time,
-            enable_permission,
+        list(
+            recordings_object.iter_recordings_details_documents(
+                DUMMY_USERS_DATA,
+                SCHEMA,
+                START_TIME,
+                END_TIME,
+                enable_permission,
+            )
         )
@@ -3,61 +3,130 @@
 # or more contributor license agreements. Licensed under the Elastic License 2.0;
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
-import json
-import logging
-import os
-import sys
 import time
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from unittest import mock
-from unittest.mock import Mock
 
-from ees_zoom.configuration import Configuration
-from ees_zoom.zoom_client import ZoomClient
+import pytest
+
+from ees_zoom import role_permissions_cache
 from ees_zoom.zoom_roles import ZoomRoles
+from support import ZOOM_ENTERPRISE_SEARCH_MAPPINGS, dump_json, get_test_logger
 
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
 ROLES = "roles"
+ROLE_MEMBERS_URL = "https://api.zoom.us/v2/roles/dummy_role_1/members"
 SCHEMA = {
     "description": "description",
     "id": "id",
     "title": "name",
 }
+DUMMY_ROLES_MEMBERS_DATA_WITH_NEXT_PAGE_TOKEN = dump_json(
+    {
+        "page_count": 1,
+        "page_number": 1,
+        "next_page_token": "dummy_next_page_token",
+        "page_size": 300,
+        "total_records": 2,
+        "members": [
+            {
+                "id": "dummy_user_id_1",
+                "email": "dummy_@dumb.com",
+                "first_name": "dummy_user",
+                "last_name": "dummy_user_lastname",
+                "type": 100,
+                "department": "dummy",
+            }
+        ],
+    }
+)
+DUMMY_ROLES_MEMBERS_DATA_WITHOUT_NEXT_PAGE_TOKEN = dump_json(
+    {
+        "page_count": 1,
+        "page_number": 1,
+        "next_page_token": "",
+        "page_size": 300,
+        "total_records": 1,
+        "members": [
+            {
+                "id": "dummy_user_id_2",
+                "email": "dummy_2@dumb.com",
+                "first_name": "dummy_user2",
+                "last_name": "dummy_user2_lastname",
+                "type": 100,
+                "department": "dummy",
+            }
+        ],
+    }
+)
 
+DUMMY_ROLES_DATA = [
+    {
+        "id": "dummy_role_1",
+        "name": "Admin",
+        "description": "Account administrator",
+        "total_members": 2,
+    },
+    {
+        "id": "dummy_role_2",
+        "name": "Member",
+        "description": "Account member",
+        "total_members": 5,
+    },
+]
 
-def settings():
-    """This function loads configuration from the file and initialize logger.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
-    :returns zoom_enterprise_search_mappings: dictionary containing mappings from zoom_user_id to enterprise_user_id
-    """
-    configuration = Configuration(file_name=CONFIG_FILE)
-    zoom_enterprise_search_mappings = {
-        "dummy_id_1": ["ent_dummy_id_1", "ent_dummy_id_1_2"],
-        "dummy_id_2": ["ent_dummy_id_2"],
-    }
-    logger = logging.getLogger("unit_test_roles")
-    return configuration, logger, zoom_enterprise_search_mappings
+logger = get_test_logger("unit_test_roles")
 
 
-def create_roles_object():
-    """This function create roles object for test.
+@pytest.fixture
+def roles_object(base_configuration, zoom_client):
+    """This fixture creates the ZoomRoles object of a test.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param zoom_client: Instance of ZoomClient with a valid access token for the test.
     :returns ZoomRoles: Instance of ZoomRoles.
     """
-    configs, logger, zoom_enterprise_search_mappings = settings()
-    zoom_client = ZoomClient(configs, logger)
-    zoom_client.access_token = "dummy"
-    zoom_client.access_token_expiration = time.time() + 4000
-    return ZoomRoles(configs, logger, zoom_client, zoom_enterprise_search_mappings)
+    return ZoomRoles(base_configuration, logger, zoom_client, ZOOM_ENTERPRISE_SEARCH_MAPPINGS)
+
+
+def test_get_roles_details_documents(roles_object):
+    """Test for generating roles documents, every role document shares the Role:Read permission.
+    :param roles_object: Instance of ZoomRoles.
+    """
+    expected_response = [
+        {
+            "type": "roles",
+            "description": "Account administrator",
+            "id": "dummy_role_1",
+            "title": "Admin",
+            "body": "Total Members : 2",
+            "url": "https://zoom.us/role#/detail/dummy_role_1/settings",
+            "_allow_permissions": ("Role:Read",),
+        },
+        {
+            "type": "roles",
+            "description": "Account member",
+            "id": "dummy_role_2",
+            "title": "Member",
+            "body": "Total Members : 5",
+            "url": "https://zoom.us/role#/detail/dummy_role_2/settings",
+            "_allow_permissions": ("Role:Read",),
+        },
+    ]
+    response = roles_object.get_roles_details_documents(SCHEMA, DUMMY_ROLES_DATA, True)
+    assert response["type"] == ROLES
+    assert response["data"] == expected_response
 
 
-def test_fetch_role_permissions(requests_mock):
+def test_get_roles_details_documents_without_permission(roles_object):
+    """Test that the roles documents have no permissions when the permission sync is disabled.
+    :param roles_object: Instance of ZoomRoles.
+    """
+    response = roles_object.get_roles_details_documents(SCHEMA, DUMMY_ROLES_DATA, False)
+    assert all("_allow_permissions" not in document for document in response["data"])
+
+
+def test_fetch_role_permissions(requests_mock, roles_object):
     """Test for fetching roles_permissions from Zoom.
     :param requests_mock: fixture for requests.get calls.
+    :param roles_object: Instance of ZoomRoles.
     """
     dummy_roles_data = {
         "id": "dummy1",
@@ -70,7 +139,6 @@ def test_fetch_role_permissions(requests_mock):
         ],
         "sub_account_privileges": {},
     }
-    roles_object = create_roles_object()
     dummy_role_id = "dummy_role_1"
     headers = {
         "authorization": "Bearer token",
@@ -86,59 +154,108 @@ def test_fetch_role_permissions(requests_mock):
     assert response == dummy_roles_data["privileges"]
 
 
-@mock.patch("requests.get")
-def test_fetch_members_of_role(mock_request_get):
+def test_fetch_members_of_role(requests_mock, roles_object):
     """Test for fetching role members from Zoom.
-    :param mock_request_get: mock patch for requests.get calls.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param roles_object: Instance of ZoomRoles.
     """
-    dummy_roles_members_data_with_next_page_token = {
-        "page_count": 1,
-        "page_number": 1,
-        "next_page_token": "dummy_next_page_token",
-        "page_size": 300,
-        "total_records": 2,
-        "members": [
-            {
-                "id": "dummy_user_id_1",
-                "email": "dummy_@dumb.com",
-                "first_name": "dummy_user",
-                "last_name": "dummy_user_lastname",
-                "type": 100,
-                "department": "dummy",
-            }
-        ],
-    }
-    dummy_roles_members_data_without_next_page_token = {
-        "page_count": 1,
-        "page_number": 1,
-        "next_page_token": "",
-        "page_size": 300,
-        "total_records": 1,
-        "members": [
-            {
-                "id": "dummy_user_id_2",
-                "email": "dummy_2@dumb.com",
-                "first_name": "dummy_user2",
-                "last_name": "dummy_user2_lastname",
-                "type": 100,
-                "department": "dummy",
-            }
-        ],
-    }
     expected_roles_members_response = ["dummy_user_id_1", "dummy_user_id_2"]
-    roles_object = create_roles_object()
     dummy_role_id = "dummy_role_1"
-    dummy_roles_members_data_with_next_page_token = json.dumps(
-        dummy_roles_members_data_with_next_page_token
-    )
-    dummy_roles_members_data_without_next_page_token = json.dumps(
-        dummy_roles_members_data_without_next_page_token
+    requests_mock.get(
+        ROLE_MEMBERS_URL,
+        [
+            {"content": DUMMY_ROLES_MEMBERS_DATA_WITH_NEXT_PAGE_TOKEN, "status_code": 200},
+            {"content": DUMMY_ROLES_MEMBERS_DATA_WITHOUT_NEXT_PAGE_TOKEN, "status_code": 200},
+        ],
     )
-    mock_response = [Mock(), Mock()]
-    mock_response[0].status_code = 200
-    mock_response[0].text = dummy_roles_members_data_with_next_page_token
-    mock_response[1].status_code = 200
-    mock_response[1].text = dummy_roles_members_data_without_next_page_token
-    mock_request_get.side_effect = mock_response
     response = roles_object.fetch_members_of_role(dummy_role_id)
     assert response == expected_roles_members_response
+
+
+@mock.patch.object(ZoomRoles, "set_list_of_roles_from_zoom")
+@mock.patch.object(ZoomRoles, "fetch_role_permissions")
+@mock.patch.object(ZoomRoles, "fetch_members_of_role")
+def test_fetch_user_ids_with_chat_access(
+    mock_members_of_role, mock_role_permission, mock_list_of_role, tmp_path, monkeypatch, roles_object
+):
+    """Test for fetching the users having read access for chat messages.
+    :param mock_members_of_role: patch object for fetch_members_of_role
+    :param mock_role_permission: patch object for fetch_role_permissions
+    :param mock_list_of_role: patch object for set_list_of_roles_from_zoom
+    :param tmp_path: fixture for the directory of the role permissions cache.
+    :param monkeypatch: fixture for patching the path of the role permissions cache.
+    :param roles_object: Instance of ZoomRoles.
+    """
+    monkeypatch.setattr(
+        role_permissions_cache,
+        "ROLE_PERMISSIONS_CACHE_PATH",
+        str(tmp_path / "role_permissions_cache.json"),
+    )
+    roles_object.roles_list = [{"id": "dummy_role_id_1"}, {"id": "dummy_role_id_2"}]
+    role_permissions = {
+        "dummy_role_id_1": ["ChatMessage:Read", "User:Read"],
+        "dummy_role_id_2": ["User:Read"],
+    }
+    role_members = {
+        "dummy_role_id_1": ["dummy_id_1", "dummy_id_2"],
+        "dummy_role_id_2": ["dummy_id_3"],
+    }
+    mock_role_permission.side_effect = role_permissions.get
+    mock_members_of_role.side_effect = role_members.get
+    response = roles_object.fetch_user_ids_with_chat_access()
+    assert response == ["dummy_id_1", "dummy_id_2"]
+    mock_members_of_role.assert_called_once_with("dummy_role_id_1")
+    # the role permissions cache is disabled by default.
+    assert not (tmp_path / "role_permissions_cache.json").exists()
+
+
+@mock.patch.object(ZoomRoles, "set_list_of_roles_from_zoom")
+@mock.patch.object(ZoomRoles, "fetch_role_permissions")
+@mock.patch.object(ZoomRoles, "fetch_members_of_role")
+def test_fetch_user_ids_with_chat_access_when_permissions_are_cached(
+    mock_members_of_role, mock_role_permission, mock_list_of_role, tmp_path, monkeypatch, roles_object
+):
+    """Test that the permissions of roles cached by a previous sync are not fetched again from Zoom.
+    :param mock_members_of_role: patch object for fetch_members_of_role
+    :param mock_role_permission: patch object for fetch_role_permissions
+    :param mock_list_of_role: patch object for set_list_of_roles_from_zoom
+    :param tmp_path: fixture for the directory of the role permissions cache.
+    :param monkeypatch: fixture for patching the path of the role permissions cache.
+    :param roles_object: Instance of ZoomRoles.
+    """
+    monkeypatch.setattr(
+        role_permissions_cache,
+        "ROLE_PERMISSIONS_CACHE_PATH",
+        str(tmp_path / "role_permissions_cache.json"),
+    )
+    monkeypatch.setattr(roles_object, "role_permissions_cache_ttl", 86400)
+    roles_object.role_permissions_cache.set_cache(
+        {
+            "dummy_role_id_1": {"has_chat_access": True, "fetched_at": time.time()},
+            "dummy_role_id_2": {"has_chat_access": True, "fetched_at": 0},
+        }
+    )
+    roles_object.roles_list = [{"id": "dummy_role_id_1"}, {"id": "dummy_role_id_2"}]
+    mock_role_permission.return_value = ["User:Read"]
+    mock_members_of_role.return_value = ["dummy_id_1"]
+    response = roles_object.fetch_user_ids_with_chat_access()
+    assert response == ["dummy_id_1"]
+    mock_role_permission.assert_called_once_with("dummy_role_id_2")
+    assert roles_object.role_permissions_cache.get_cache()["dummy_role_id_2"][
+        "has_chat_access"
+    ] is False
+
+
+@pytest.mark.parametrize("cache_content", [None, "", "{not json"], ids=["missing_file", "empty_file", "corrupted_file"])
+def test_get_role_permissions_cache_when_unusable(tmp_path, monkeypatch, roles_object, cache_content):
+    """Test that a missing, empty or corrupted role permissions cache file is read as an empty cache.
+    :param tmp_path: fixture for the directory of the role permissions cache.
+    :param monkeypatch: fixture for patching the path of the role permissions cache.
+    :param roles_object: Instance of ZoomRoles.
+    :param cache_content: content of the cache file, None when the file does not exist.
+    """
+    cache_path = tmp_path / "role_permissions_cache.json"
+    monkeypatch.setattr(role_permissions_cache, "ROLE_PERMISSIONS_CACHE_PATH", str(cache_path))
+    if cache_content is not None:
+        cache_path.write_text(cache_content, encoding="UTF-8")
+    assert roles_object.role_permissions_cache.get_cache() == {}
@@ -3,71 +3,24 @@
 # or more contributor license agreements. Licensed under the Elastic License 2.0;
 # you may not use this file except in compliance with the Elastic License 2.0.
 #
-import datetime
-import json
-import logging
-import os
-import sys
-import time
 
 import pytest
-import requests
-from ees_zoom.utils import split_list_into_buckets
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from unittest import mock  # noqa
-from unittest.mock import Mock  # noqa
+from ees_zoom.utils import parse_rfc_3339_datetime, split_iterable_into_buckets
+from ees_zoom.zoom_users import ZoomUsers
+from support import ZOOM_ENTERPRISE_SEARCH_MAPPINGS, dump_json, get_test_logger
 
-from ees_zoom.configuration import Configuration  # noqa
-from ees_zoom.constant import RFC_3339_DATETIME_FORMAT  # noqa
-from ees_zoom.zoom_client import ZoomClient  # noqa
-from ees_zoom.zoom_users import ZoomUsers  # noqa
-
-CONFIG_FILE = os.path.join(
-    os.path.join(os.path.dirname(__file__), "config"),
-    "zoom_connector.yml",
-)
 USERS = "users"
+USERS_URL = "https://api.zoom.us/v2/users"
 SCHEMA = {
     "created_at": "created_at",
     "id": "id",
     "title": "first_name",
 }
-
-
-def settings():
-    """This Method loads configuration from the file and initialize logger.
-    :returns configuration: Configuration instance
-    :returns logger: Logger instance
-    :returns zoom_enterprise_search_mappings: dictionary containing mappings from zoom_user_id to enterprise_user_id
-    """
-    configuration = Configuration(file_name=CONFIG_FILE)
-    zoom_enterprise_search_mappings = {
-        "dummy_id_1": ["ent_dummy_id_1", "ent_dummy_id_1_2"],
-        "dummy_id_2": ["ent_dummy_id_2"],
-    }
-    logger = logging.getLogger("unit_test_users")
-    return configuration, logger, zoom_enterprise_search_mappings
-
-
-def create_users_object():
-    """This Method create ZoomUsers object for test.
-    :returns ZoomUsers: Instance of ZoomUsers.
-    """
-
-    configs, logger, zoom_enterprise_search_mappings = settings()
-    zoom_client = ZoomClient(configs, logger)
-    zoom_client.access_token = "dummy"
-    zoom_client.access_token_expiration = time.time() + 4000
-    return ZoomUsers(configs, logger, zoom_client, zoom_enterprise_search_mappings)
-
-
-@mock.patch("requests.get")
-def test_get_users_list_positive(mock_request_get):
-    """Test Method to get all users from Zoom.
-    :param mock_request_get: mock patch for requests.get calls."""
-    users_object = create_users_object()
-    mock_resp_with_next_page_token = {
+START_TIME = parse_rfc_3339_datetime("2020-05-11T06:20:41Z")
+END_TIME = parse_rfc_3339_datetime("2020-06-11T06:20:41Z")
+MOCK_RESP_WITH_NEXT_PAGE_TOKEN = dump_json(
+    {
         "page_count": 2,
         "page_number": 1,
         "page_size": 300,
@@ -95,7 +48,9 @@ def test_get_users_list_positive(mock_request_get):
             },
         ],
     }
-    mock_resp_without_next_page_token = {
+)
+MOCK_RESP_WITHOUT_NEXT_PAGE_TOKEN = dump_json(
+    {
         "page_count": 2,
         "page_number": 1,
         "page_size": 300,
@@ -123,6 +78,58 @@ def test_get_users_list_positive(mock_request_get):
             },
         ],
     }
+)
+DUMMY_USERS_DATA = [
+    {
+        "id": "dummy_id_1",
+        "first_name": "user1",
+        "last_name": "abc",
+        "email": "dummy@dummy.com",
+        "type": 2,
+        "pmi": 12341234,
+        "timezone": "Planet/Earth",
+        "verified": 1,
+        "dept": "",
+        "created_at": "2020-05-11T06:20:41Z",
+        "last_login_time": "2222-22-22T22:22:22Z",
+        "last_client_version": "5.9.1.3506(mac)",
+        "pic_url": "https://dummy_user_id1_url.com/",
+        "language": "en-US",
+        "phone_number": "",
+        "status": "Passive",
+        "role_id": "0",
+    }
+]
+EXPECTED_RESPONSE = [
+    {
+        "type": "users",
+        "created_at": "2020-05-11T06:20:41Z",
+        "id": "dummy_id_1",
+        "title": "user1",
+        "body": "First Name : user1\nLast Name : abc\nStatus : Passive\nRole Id : 0\nEmail : dummy@dummy.com",
+        "url": "https://zoom.us/user/dummy_id_1/profile",
+        "_allow_permissions": ("User:Read", "ent_dummy_id_1", "ent_dummy_id_1_2"),
+    }
+]
+
+logger = get_test_logger("unit_test_users")
+
+
+@pytest.fixture
+def users_object(base_configuration, zoom_client):
+    """This fixture creates the ZoomUsers object of a test.
+    :param base_configuration: Configuration instance shared by the test session.
+    :param zoom_client: Instance of ZoomClient with a valid access token for the test.
+    :returns ZoomUsers: Instance of ZoomUsers.
+    """
+    return ZoomUsers(base_configuration, logger, zoom_client, ZOOM_ENTERPRISE_SEARCH_MAPPINGS)
+
+
+def test_iter_users_positive(requests_mock, users_object):
+    """Test Method to get all users from Zoom.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param users_object: Instance of ZoomUsers.
+    """
     expected_response = [
         [
             {
@@ -167,87 +174,59 @@ def test_get_users_list_positive(mock_request_get):
             }
         ],
     ]
-    mock_resp_with_next_page_token = json.dumps(mock_resp_with_next_page_token)
-    mock_resp_without_next_page_token = json.dumps(mock_resp_without_next_page_token)
-    mock_response = [Mock(), Mock()]
-    mock_response[0].status_code = 200
-    mock_response[0].text = mock_resp_with_next_page_token
-    mock_response[1].status_code = 200
-    mock_response[1].text = mock_resp_without_next_page_token
-    mock_request_get.side_effect = mock_response
-    user_list = users_object.get_users_list()
-    partitioned_users_list = split_list_into_buckets(
-        user_list,
+    requests_mock.get(
+        USERS_URL,
+        [
+            {"content": MOCK_RESP_WITH_NEXT_PAGE_TOKEN, "status_code": 200},
+            {"content": MOCK_RESP_WITHOUT_NEXT_PAGE_TOKEN, "status_code": 200},
+        ],
+    )
+    partitioned_users_list = split_iterable_into_buckets(
+        users_object.iter_users(),
         users_object.config.get_value("zoom_sync_thread_count"),
     )
     assert partitioned_users_list == expected_response
 
 
-def test_get_users_details_documents():
-    """Test for getting all users documents generated using users_data."""
-    users_data = [
-        {
-            "id": "dummy_id_1",
-            "first_name": "user1",
-            "last_name": "abc",
-            "email": "dummy@dummy.com",
-            "type": 2,
-            "pmi": 12341234,
-            "timezone": "Planet/Earth",
-            "verified": 1,
-            "dept": "",
-            "created_at": "2020-05-11T06:20:41Z",
-            "last_login_time": "2222-22-22T22:22:22Z",
-            "last_client_version": "5.9.1.3506(mac)",
-            "pic_url": "https://dummy_user_id1_url.com/",
-            "language": "en-US",
-            "phone_number": "",
-            "status": "Passive",
-            "role_id": "0",
-        }
-    ]
-    start_time = datetime.datetime.strptime(
-        "2020-05-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-    end_time = datetime.datetime.strptime(
-        "2020-06-11T06:20:41Z", RFC_3339_DATETIME_FORMAT
-    )
-
-    expected_response_data = [
-        {
-            "type": "users",
-            "created_at": "2020-05-11T06:20:41Z",
-            "id": "dummy_id_1",
-            "title": "user1",
-            "body": "First Name : user1\nLast Name : abc\nStatus : Passive\nRole Id : 0\nEmail : dummy@dummy.com",
-            "url": "https://zoom.us/user/dummy_id_1/profile",
-            "_allow_permissions": ["User:Read", "ent_dummy_id_1", "ent_dummy_id_1_2"],
-        }
-    ]
+def test_get_users_details_documents(users_object):
+    """Test for getting all users documents generated using users_data.
+    :param users_object: Instance of ZoomUsers.
+    """
     enable_permission = True
-    users_object = create_users_object()
     response = users_object.get_users_details_documents(
         SCHEMA,
-        users_data,
-        start_time,
-        end_time,
+        DUMMY_USERS_DATA,
+        START_TIME,
+        END_TIME,
         enable_permission,
     )
     assert response["type"] == USERS
-    assert response["data"] == expected_response_data
+    assert response["data"] == EXPECTED_RESPONSE
+
+
+def test_get_users_details_documents_for_unmapped_users(users_object):
+    """Test that the documents of the users having no Enterprise Search mapping only get the User:Read permission.
+    :param users_object: Instance of ZoomUsers.
+    """
+    unmapped_users_data = [
+        {**DUMMY_USERS_DATA[0], "id": "dummy_unmapped_id_1"},
+        {**DUMMY_USERS_DATA[0], "id": "dummy_unmapped_id_2"},
+    ]
+    response = users_object.get_users_details_documents(
+        SCHEMA,
+        unmapped_users_data,
+        START_TIME,
+        END_TIME,
+        True,
+    )
+    assert [document["_allow_permissions"] for document in response["data"]] == [("User:Read",), ("User:Read",)]
 
 
-@mock.patch("requests.get")
-def test_get_users_list_negative(mock_request_get):
+def test_iter_users_negative(requests_mock, users_object):
     """Test case where Zoom is down
-    :param mock_request_get: mock patch for requests.get calls.
+    :param requests_mock: fixture for mocking the Zoom endpoints.
+    :param users_object: Instance of ZoomUsers.
     """
-    users_object = create_users_object()
-    mock_response = [mock.Mock()]
-    mock_response[0].status_code = 500
-    mock_response[0].raise_for_status = mock.Mock()
-    raise_for_status = requests.exceptions.HTTPError
-    mock_response[0].raise_for_status.side_effect = raise_for_status
-    mock_request_get.return_value = mock_response
+    requests_mock.get(USERS_URL, status_code=500)
     with pytest.raises(Exception):
-        assert users_object.get_users_list()
+        assert list(users_object.iter_users())